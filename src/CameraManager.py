@@ -355,8 +355,8 @@ class CameraManager(QObject):
     camera_processed = pyqtSignal(str)  # camera_id - processing complete
     frame_ready = pyqtSignal(str, np.ndarray)  # For config page only - temporary frame display
 
-    def __init__(self, interval: int = 5000, use_gpu: bool = False):
-        super().__init__()
+    def __init__(self, interval: int = 5000, use_gpu: bool = False, parent=None):
+        super().__init__(parent)
 
         # Create worker thread
         self.worker_thread = QThread()
@@ -376,6 +376,7 @@ class CameraManager(QObject):
         self.worker_thread.start()
 
         self.running = False
+        self._shut_down = False
 
         # Get initial camera count for logging
         try:
@@ -535,6 +536,10 @@ class CameraManager(QObject):
 
     def shutdown(self):
         """Properly shutdown the camera manager and clean up resources"""
+        # Runs once; __del__ may call it again after Qt has destroyed the thread pool
+        if getattr(self, '_shut_down', False):
+            return
+        self._shut_down = True
         print("Shutting down CameraManager...")
         self.stop_monitoring()
 
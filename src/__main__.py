@@ -1,12 +1,18 @@
 import sys
 import os
+import logging
 import torch
 from PyQt6.QtWidgets import QApplication, QDialog
+from PyQt6.QtGui import QPixmapCache
 from src.gui.window import Window
+from src.gui.Dashboard import DASHBOARD_QSS
 from src.gui.GmailCard import GmailDialog
 from dotenv import load_dotenv
 
 def main():
+    # Only warnings and errors by default, per-event debug output stays off
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
     app = QApplication(sys.argv)
     app.setApplicationName("Illegal Parking Monitor")
     app.setApplicationDisplayName("Illegal Parking Monitor")
@@ -14,6 +20,12 @@ def main():
     app.setOrganizationName("Parking System")
     app.setStyle('Fusion')
 
+    # Room for decoded camera card thumbnails (size in KB)
+    QPixmapCache.setCacheLimit(65536)
+
+    # Application-wide stylesheet, parsed once and shared by every dashboard
+    app.setStyleSheet(DASHBOARD_QSS)
+
     # Check for GPU usage with robust error handling
     use_gpu = False
     gpu_reason = "CPU mode (default)"
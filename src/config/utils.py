@@ -1,12 +1,28 @@
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+import stat
+import tempfile
+import threading
+from typing import Dict, List, Optional, Set, Tuple, Any, TYPE_CHECKING
 from datetime import datetime
 from src.enums import CameraStatus, ParkingStatus
 
 if TYPE_CHECKING:
     from typing import Self
 
+logger = logging.getLogger(__name__)
+
+# Reads and writes are serialized per configuration file, every manager instance on the same path shares a lock
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+def _lock_for_path(path: str) -> threading.Lock:
+    """Get the lock shared by all readers and writers of a configuration file"""
+    key = os.path.abspath(path)
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
+
 class CameraReference:
     """
     Helper class to hold camera ID and name together for safer operations
@@ -42,28 +58,121 @@ class CameraConfigManager:
         
         self.config_file_path = config_file_path
         self._config_data = None
+        self._cached_mtime = None  # File stamp of the data in _config_data
+        self._id_index = {}  # camera_id -> position in _config_data['cameras']
+        self._name_index = {}  # camera_name -> position in _config_data['cameras']
+        self._display_labels = {}  # camera_id -> (camera_name, list label), kept out of the saved data
+        self._ui_cameras = None  # get_cameras_for_ui() result for the file stamp in _ui_cameras_stamp
+        self._ui_cameras_stamp = None
+        self._lock = threading.RLock()  # Serializes loads, saves and edits across threads
         self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
         """
-        Load camera configuration from JSON file
+        Load camera configuration from JSON file, reusing the parsed data while
+        the file's (mtime, size, inode) stamp is unchanged
         
         Returns:
             Dictionary containing the configuration data
         """
-        try:
-            with open(self.config_file_path, 'r', encoding='utf-8') as file:
-                self._config_data = json.load(file)
+        with self._lock:
+            try:
+                stamp = self._file_stamp()
+                if self._config_data is not None and stamp == self._cached_mtime:
+                    return self._config_data
+                
+                # Hold the writers' lock while the file is open, os.replace fails on Windows
+                # while another thread has the target open
+                with _lock_for_path(self.config_file_path):
+                    stamp = self._file_stamp()
+                    with open(self.config_file_path, 'r', encoding='utf-8') as file:
+                        self._config_data = json.load(file)
+                self._cached_mtime = stamp
+                self._rebuild_id_index()
                 return self._config_data
-        except FileNotFoundError:
-            print(f"Configuration file not found: {self.config_file_path}")
-            return self._create_default_config()
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON configuration: {e}")
-            return self._create_default_config()
-        except Exception as e:
-            print(f"Error loading configuration: {e}")
-            return self._create_default_config()
+            except FileNotFoundError:
+                print(f"Configuration file not found: {self.config_file_path}")
+                return self._create_default_config()
+            except json.JSONDecodeError as e:
+                print(f"Error parsing JSON configuration: {e}")
+                return self._create_default_config()
+            except Exception as e:
+                print(f"Error loading configuration: {e}")
+                return self._create_default_config()
+    
+    def _rebuild_id_index(self):
+        """Rebuild the camera_id and camera_name -> list position indexes and the display labels"""
+        self._id_index = {}
+        self._name_index = {}
+        self._display_labels = {}
+        for i, camera in enumerate(self._config_data.get('cameras', [])):
+            self._id_index.setdefault(camera.get('camera_id'), i)
+            self._name_index.setdefault(camera.get('camera_name'), i)
+            self.get_display_label(camera)
+    
+    def get_display_label(self, camera: Dict[str, Any]) -> str:
+        """
+        Get the "name (id)" label shown for a camera in lists, built once per name
+        
+        Args:
+            camera: Camera configuration dictionary
+            
+        Returns:
+            Display label for the camera
+        """
+        camera_id = camera.get('camera_id', 'Unknown')
+        camera_name = camera.get('camera_name', 'Unnamed Camera')
+        cached = self._display_labels.get(camera_id)
+        if cached is None or cached[0] != camera_name:
+            cached = (camera_name, f"{camera_name} ({camera_id})")
+            self._display_labels[camera_id] = cached
+        return cached[1]
+    
+    def _index_of(self, camera_id: str) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get the camera list and a camera's position in it, rebuilding the index if it is stale.
+        Callers hold self._lock while using the result, so another thread cannot reload the list
+        between the lookup and the indexing
+        """
+        with self._lock:
+            cameras = self.get_all_cameras()
+            index = self._id_index.get(camera_id)
+            if index is None or index >= len(cameras) or cameras[index].get('camera_id') != camera_id:
+                self._rebuild_id_index()
+                index = self._id_index.get(camera_id)
+            return cameras, index
+    
+    def _name_index_of(self, camera_name: str) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get the camera list and the position of the first camera with a name in it, rebuilding
+        the index if it is stale. Callers hold self._lock while using the result
+        """
+        with self._lock:
+            cameras = self.get_all_cameras()
+            index = self._name_index.get(camera_name)
+            if index is None or index >= len(cameras) or cameras[index].get('camera_name') != camera_name:
+                self._rebuild_id_index()
+                index = self._name_index.get(camera_name)
+            return cameras, index
+    
+    def _file_stamp(self):
+        """Get the (mtime, size, inode) stamp of the configuration file"""
+        st = os.stat(self.config_file_path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def reload_if_changed(self) -> Dict[str, Any]:
+        """
+        Reload the configuration only if the file changed since it was last read
+        
+        Returns:
+            Dictionary containing the configuration data
+        """
+        return self.load_config()
+    
+    def invalidate(self):
+        """Force the next load_config() to re-read the file, e.g. after an external write"""
+        with self._lock:
+            self._cached_mtime = None
     
     def save_config(self) -> bool:
         """
@@ -72,17 +181,41 @@ class CameraConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Update last_updated timestamp
-            if self._config_data:
-                self._config_data['last_updated'] = datetime.now().isoformat() + 'Z'
-            
-            with open(self.config_file_path, 'w', encoding='utf-8') as file:
-                json.dump(self._config_data, file, indent=2, ensure_ascii=False)
+        with self._lock, _lock_for_path(self.config_file_path):
+            temp_path = None
+            try:
+                # Update last_updated timestamp
+                if self._config_data:
+                    self._config_data['last_updated'] = datetime.now().isoformat() + 'Z'
+            
+                # Write to a temporary file of our own and swap it in, so readers never see a partial file
+                directory, name = os.path.split(os.path.abspath(self.config_file_path))
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + '.', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump(self._config_data, file, indent=2, ensure_ascii=False)
+                    file.flush()
+                    try:
+                        # mkstemp creates the file private, keep the permissions of the file it replaces
+                        os.fchmod(file.fileno(), stat.S_IMODE(os.stat(self.config_file_path).st_mode))
+                    except (OSError, AttributeError):
+                        pass
+                    # Stamp of the file we wrote, the inode is kept by the rename
+                    written = os.fstat(file.fileno())
+                os.replace(temp_path, self.config_file_path)
+                temp_path = None
+                self._cached_mtime = (written.st_mtime_ns, written.st_size, written.st_ino)
                 return True
-        except Exception as e:
-            print(f"Error saving configuration: {e}")
-            return False
+            except Exception as e:
+                print(f"Error saving configuration: {e}")
+                # In-memory data no longer matches the file, force a reload next time
+                self.invalidate()
+                return False
+            finally:
+                if temp_path is not None:
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
     
     def get_all_cameras(self) -> List[Dict[str, Any]]:
         """
@@ -91,7 +224,7 @@ class CameraConfigManager:
         Returns:
             List of camera configuration dictionaries
         """
-        self.load_config()
+        self.reload_if_changed()
         
         return self._config_data.get('cameras', [])
     
@@ -105,6 +238,24 @@ class CameraConfigManager:
         cameras = self.get_all_cameras()
         return [camera.get('camera_id') for camera in cameras if camera.get('camera_id')]
     
+    def camera_count(self) -> int:
+        """
+        Get the number of cameras in the loaded configuration (no reload)
+        
+        Returns:
+            Number of cameras
+        """
+        return len(self._config_data.get('cameras', ()))
+    
+    def get_existing_ids(self) -> Set[str]:
+        """
+        Get the set of all camera IDs for fast membership checks
+        
+        Returns:
+            Set of camera IDs
+        """
+        return {camera.get('camera_id') for camera in self.get_all_cameras()}
+    
     def get_camera_by_id_and_name(self, camera_id: str, camera_name: str) -> Optional[Dict[str, Any]]:
         """
         Get camera configuration by both ID and name (both required)
@@ -116,11 +267,19 @@ class CameraConfigManager:
         Returns:
             Camera configuration dictionary or None if not found
         """
-        cameras = self.get_all_cameras()
-        for camera in cameras:
-            if camera.get('camera_id') == camera_id and camera.get('camera_name') == camera_name:
+        with self._lock:
+            cameras, index = self._index_of(camera_id)
+            if index is None:
+                return None
+            camera = cameras[index]
+            if camera.get('camera_name') == camera_name:
                 return camera
-        return None
+            
+            # Only reached when the id is duplicated or the name does not match
+            for camera in cameras:
+                if camera.get('camera_id') == camera_id and camera.get('camera_name') == camera_name:
+                    return camera
+            return None
     
     def get_camera_by_id(self, camera_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -132,11 +291,9 @@ class CameraConfigManager:
         Returns:
             Camera configuration dictionary or None if not found
         """
-        cameras = self.get_all_cameras()
-        for camera in cameras:
-            if camera.get('camera_id') == camera_id:
-                return camera
-        return None
+        with self._lock:
+            cameras, index = self._index_of(camera_id)
+            return cameras[index] if index is not None else None
     
     def get_camera_by_name(self, camera_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -148,11 +305,9 @@ class CameraConfigManager:
         Returns:
             Camera configuration dictionary or None if not found
         """
-        cameras = self.get_all_cameras()
-        for camera in cameras:
-            if camera.get('camera_name') == camera_name:
-                return camera
-        return None
+        with self._lock:
+            cameras, index = self._name_index_of(camera_name)
+            return cameras[index] if index is not None else None
     
     def get_camera_names(self) -> List[str]:
         """
@@ -187,10 +342,13 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         camera = self.get_camera_by_id_and_name(camera_id, camera_name)
         if camera:
+            # Already saved with this status, skip rewriting the file
+            if camera.get('camera_status') == status:
+                return True
             camera['camera_status'] = status
             return self.save_config()
         return False
@@ -207,11 +365,13 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         cameras = self.get_all_cameras()
         for camera in cameras:
             if camera.get('camera_id') == camera_id:
+                if camera.get('camera_status') == status:
+                    return True
                 camera['camera_status'] = status
                 return self.save_config()
         return False
@@ -229,10 +389,13 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         camera = self.get_camera_by_id_and_name(camera_id, camera_name)
         if camera:
+            # Already saved with this status, skip rewriting the file
+            if camera.get('parking_status') == parking_status:
+                return True
             camera['parking_status'] = parking_status
             return self.save_config()
         return False
@@ -249,15 +412,48 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         cameras = self.get_all_cameras()
         for camera in cameras:
             if camera.get('camera_id') == camera_id:
+                if camera.get('parking_status') == parking_status:
+                    return True
                 camera['parking_status'] = parking_status
                 return self.save_config()
         return False
     
+    def update_camera_statuses(self, updates: Dict[Tuple[str, str], Dict[str, Any]]) -> bool:
+        """
+        Apply status changes for several cameras and save the configuration once
+        
+        Args:
+            updates: Maps (camera_id, camera_name) to the fields to set, e.g.
+                {'camera_status': 'error', 'parking_status': 'unknown'}
+            
+        Returns:
+            True if every camera was found and saved (or already up to date), False otherwise
+        """
+        with self._lock:
+            # Load latest configuration before updating
+            self.reload_if_changed()
+            
+            found_all = True
+            changed = False
+            for (camera_id, camera_name), fields in updates.items():
+                camera = self.get_camera_by_id_and_name(camera_id, camera_name)
+                if not camera:
+                    found_all = False
+                    continue
+                for key, value in fields.items():
+                    if camera.get(key) != value:
+                        camera[key] = value
+                        changed = True
+            
+            if changed and not self.save_config():
+                return False
+            return found_all
+    
     def update_detection_zone(self, camera_id: str, camera_name: str, detection_zones: List[Dict]) -> bool:
         """
         Update detection zones for a camera (requires both camera_id and camera_name)
@@ -275,7 +471,7 @@ class CameraConfigManager:
             return False
         
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         # Convert frame data to detection zones
         zones = []
@@ -320,7 +516,7 @@ class CameraConfigManager:
             return False
         
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         # Convert frame data to detection zones
         zones = []
@@ -360,23 +556,47 @@ class CameraConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        # Load latest configuration before adding
-        self.load_config()
+        with self._lock:
+            # Load latest configuration before adding
+            self.reload_if_changed()
+        
+            # Validate required fields
+            required_fields = ['camera_id', 'camera_name', 'video_source', ]
+            for field in required_fields:
+                if field not in camera_config:
+                    print(f"Missing required field: {field}")
+                    return False
         
-        # Validate required fields
-        required_fields = ['camera_id', 'camera_name', 'video_source', ]
-        for field in required_fields:
-            if field not in camera_config:
-                print(f"Missing required field: {field}")
+            # Check if camera ID already exists
+            if self.get_camera_by_id(camera_config['camera_id']):
+                print(f"Camera with ID {camera_config['camera_id']} already exists")
                 return False
         
-        # Check if camera ID already exists
-        if self.get_camera_by_id(camera_config['camera_id']):
-            print(f"Camera with ID {camera_config['camera_id']} already exists")
-            return False
+            self._id_index[camera_config['camera_id']] = len(self._config_data['cameras'])
+            self._config_data['cameras'].append(camera_config)
+            return self.save_config()
+    
+    def update_camera(self, camera_id: str, camera_config: Dict[str, Any]) -> bool:
+        """
+        Replace the whole configuration of an existing camera
         
-        self._config_data['cameras'].append(camera_config)
-        return self.save_config()
+        Args:
+            camera_id: The camera ID to replace
+            camera_config: Dictionary containing the new camera configuration
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._lock:
+            # Load latest configuration before updating
+            self.reload_if_changed()
+        
+            cameras, index = self._index_of(camera_id)
+            if index is None:
+                return False
+        
+            cameras[index] = camera_config
+            return self.save_config()
     
     def remove_camera(self, camera_id: str, camera_name: str) -> bool:
         """
@@ -389,42 +609,34 @@ class CameraConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Load latest configuration before removing
-            self.load_config()
+        with self._lock:
+            try:
+                # Load latest configuration before removing
+                self.reload_if_changed()
             
-            print(f"DEBUG: remove_camera called with ID: '{camera_id}', Name: '{camera_name}'")
+                logger.debug("remove_camera called with ID: '%s', Name: '%s'", camera_id, camera_name)
             
-            cameras = self.get_all_cameras()
-            print(f"DEBUG: Total cameras in config: {len(cameras)}")
-            
-            # Debug: Print all camera IDs and names
-            for i, camera in enumerate(cameras):
-                cam_id = camera.get('camera_id', 'MISSING')
-                cam_name = camera.get('camera_name', 'MISSING')
-                print(f"DEBUG: Camera {i}: ID='{cam_id}', Name='{cam_name}'")
+                cameras = self.get_all_cameras()
+                logger.debug("Total cameras in config: %d", len(cameras))
             
-            for i, camera in enumerate(cameras):
-                cam_id = camera.get('camera_id')
-                cam_name = camera.get('camera_name')
+                for i, camera in enumerate(cameras):
+                    cam_id = camera.get('camera_id')
+                    cam_name = camera.get('camera_name')
                 
-                print(f"DEBUG: Checking camera {i}: ID='{cam_id}' vs '{camera_id}', Name='{cam_name}' vs '{camera_name}'")
-                
-                if cam_id == camera_id and cam_name == camera_name:
-                    print(f"DEBUG: Found matching camera at index {i}, removing...")
-                    del self._config_data['cameras'][i]
-                    success = self.save_config()
-                    print(f"DEBUG: Save result: {success}")
-                    return success
-            
-            print(f"DEBUG: No matching camera found for ID: '{camera_id}', Name: '{camera_name}'")
-            return False
+                    if cam_id == camera_id and cam_name == camera_name:
+                        logger.debug("Found matching camera at index %d, removing...", i)
+                        del self._config_data['cameras'][i]
+                        self._rebuild_id_index()
+                        success = self.save_config()
+                        logger.debug("Save result: %s", success)
+                        return success
+            
+                logger.debug("No matching camera found for ID: '%s', Name: '%s'", camera_id, camera_name)
+                return False
             
-        except Exception as e:
-            print(f"DEBUG: Exception in remove_camera: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
+            except Exception:
+                logger.exception("Exception in remove_camera")
+                return False
     
     def remove_camera_legacy(self, camera_id: str) -> bool:
         """
@@ -436,15 +648,17 @@ class CameraConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        # Load latest configuration before removing
-        self.load_config()
+        with self._lock:
+            # Load latest configuration before removing
+            self.reload_if_changed()
         
-        cameras = self.get_all_cameras()
-        for i, camera in enumerate(cameras):
-            if camera.get('camera_id') == camera_id:
-                del self._config_data['cameras'][i]
-                return self.save_config()
-        return False
+            cameras = self.get_all_cameras()
+            for i, camera in enumerate(cameras):
+                if camera.get('camera_id') == camera_id:
+                    del self._config_data['cameras'][i]
+                    self._rebuild_id_index()
+                    return self.save_config()
+            return False
     
     def get_system_settings(self) -> Dict[str, Any]:
         """
@@ -469,7 +683,7 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         if 'system_settings' not in self._config_data:
             self._config_data['system_settings'] = {}
@@ -479,12 +693,35 @@ class CameraConfigManager:
     
     def get_cameras_for_ui(self) -> List[Dict[str, Any]]:
         """
-        Get camera data formatted for UI components
+        Get camera data formatted for UI components, built once per configuration change
+        
+        The list and its dictionaries are shared between callers and must not be modified.
         
         Returns:
             List of camera dictionaries formatted for UI
         """
-        cameras = self.get_all_cameras()
+        return self.get_cameras_with_ui()[1]
+    
+    def get_cameras_with_ui(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get the camera configurations and their UI formatted list from the same read, so both
+        describe one version of the file even if another thread writes it in between
+        
+        Both lists are shared between callers and must not be modified.
+        
+        Returns:
+            Tuple of (camera configuration dictionaries, camera dictionaries formatted for UI)
+        """
+        with self._lock:
+            cameras = self.get_all_cameras()
+            if self._ui_cameras is None or self._cached_mtime is None \
+                    or self._ui_cameras_stamp != self._cached_mtime:
+                self._ui_cameras = self._build_cameras_for_ui(cameras)
+                self._ui_cameras_stamp = self._cached_mtime
+            return cameras, self._ui_cameras
+    
+    def _build_cameras_for_ui(self, cameras: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format camera configurations for UI components"""
         ui_cameras = []
         
         for camera in cameras:
@@ -529,6 +766,7 @@ class CameraConfigManager:
         }
         
         self._config_data = default_config
+        self._rebuild_id_index()
         self.save_config()
         return default_config
     
@@ -577,11 +815,7 @@ class CameraConfigManager:
         Returns:
             True if ID exists, False otherwise
         """
-        cameras = self.get_all_cameras()
-        for camera in cameras:
-            if camera.get('camera_id') == camera_id:
-                return True
-        return False
+        return self._index_of(camera_id)[1] is not None
 
     def update_camera_property(self, camera_id: str, camera_name: str, property_name: str, property_value: Any) -> bool:
         """
@@ -597,7 +831,7 @@ class CameraConfigManager:
             True if successful, False otherwise
         """
         # Load latest configuration before updating
-        self.load_config()
+        self.reload_if_changed()
         
         camera = self.get_camera_by_id_and_name(camera_id, camera_name)
         if camera:
@@ -713,11 +947,14 @@ class CameraConfigManager:
         """
         try:
             # Load latest configuration before updating
-            self.load_config()
+            self.reload_if_changed()
             
             cameras = self.get_all_cameras()
             for i, camera in enumerate(cameras):
                 if camera.get('camera_id') == camera_id:
+                    # Frames are saved to a fixed path per camera, usually nothing to write
+                    if camera.get('image_path') == image_path:
+                        return True
                     # Update the image field
                     self._config_data['cameras'][i]['image_path'] = image_path
                     # Save the updated configuration
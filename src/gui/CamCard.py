@@ -1,355 +1,252 @@
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QScrollArea, QMessageBox
-from PyQt6.QtGui import QPixmap, QFont, QImage
-import cv2 as cv
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel,
+                             QListView, QAbstractItemView, QStyledItemDelegate, QStyle, QSizePolicy)
+from PyQt6.QtGui import QPixmap, QPixmapCache, QFont, QPainter, QPainterPath, QPen, QColor, QFontMetrics
+import logging
 import os
 
 from src.config.utils import CameraConfigManager
 from src.enums import ParkingStatus, CameraStatus
-class CamCard(QWidget):
-    card_clicked = pyqtSignal(str)  # Signal emitted when card is clicked
-    
-    def __init__(self, camera_name="Unknown", camera_id="0", location="Unknown", 
-                 camera_status=CameraStatus.ERROR.value, parking_status=ParkingStatus.UNKNOWN.value, 
-                 video_source=None, image_path=None, card_size=(400, 480)):
-        super().__init__()        
-        self.camera_name = camera_name
-        self.camera_id = camera_id
-        self.location = location
-        self.camera_status = camera_status  # CameraStatus enum values
-        self.parking_status = parking_status  # ParkingStatus enum values
-        self.video_source = video_source
-        self.image_path = image_path  # Path to the latest saved image
-        
-        self.init_ui()
-        self.setFixedSize(card_size[0], card_size[1])
-        # Border styling moved to container frame in init_ui()
 
-    def init_ui(self):
-        # Create main layout with proper margins for border
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(3, 3, 3, 3)  # Account for border width
-        main_layout.setSpacing(0)
-        
-        # Create a container frame for the border (responsive to card size)
-        container_frame = QFrame()
-        container_frame.setObjectName("CamCardContainer")
-        container_frame.setFixedSize(314, 400)
-        container_frame.setStyleSheet("""
-            QFrame#CamCardContainer {
-                border: 3px solid #2a2a2a;
-                background-color: #2a2a2a;
-                border-radius: 12px;
-            }
-            QFrame#CamCardContainer:hover {
-                border: 3px solid #4a9eff;
-                background-color: #323232;
-            }
-        """)
-        
-        main_layout.addWidget(container_frame)
-        
-        # Make the card look clickable
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        container_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-        
-        # Create content layout inside the container
-        layout = QVBoxLayout(container_frame)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        # Calculate available width for content within the container
-        content_width = 314  # Container width
-        image_height = 220
-        content_height = 180
-        
-        # Image section (responsive height, rounded top corners)
-        self.image_label = QLabel()
-        self.image_label.setFixedSize(content_width, image_height)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border-top-left-radius: 9px;
-                border-top-right-radius: 9px;
-                border: none;
-            }
-        """)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setScaledContents(True)
-        
-        # Load image or show placeholder
-        self.load_image()
-        layout.addWidget(self.image_label)
-        
-        # Content section (responsive height)
-        content_widget = QWidget()
-        content_widget.setFixedSize(content_width, content_height)
-        content_widget.setStyleSheet("QWidget { border: none; background-color: #1a1a1a; }")
-        content_layout = QVBoxLayout(content_widget)
-        
-        # Responsive margins and spacing based on card size
-        margin_size = max(10, int(content_width * 0.04))  # 4% of width, minimum 10px
-        spacing_size = max(8, int(content_height * 0.06))  # 6% of height, minimum 8px
-        
-        content_layout.setContentsMargins(margin_size, margin_size, margin_size, margin_size)
-        content_layout.setSpacing(spacing_size)
-        
-        # Camera name and ID row
-        name_id_layout = QHBoxLayout()
-        name_id_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Responsive font sizes
-        name_font_size = max(12, int(content_width * 0.035))  # 3.5% of width
-        id_font_size = max(10, int(content_width * 0.03))     # 3% of width
-        
-        name_label = QLabel(self.camera_name)
-        name_label.setFont(QFont("Arial", name_font_size, QFont.Weight.Bold))
-        name_label.setStyleSheet("color: #ffffff;")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        id_label = QLabel(f"#{self.camera_id}")
-        id_label.setFont(QFont("Arial", id_font_size))
-        id_label.setStyleSheet("color: #cccccc; margin-left: 5px;")
-        
-        name_id_layout.addStretch()
-        name_id_layout.addWidget(name_label)
-        name_id_layout.addWidget(id_label)
-        name_id_layout.addStretch()
-        
-        content_layout.addLayout(name_id_layout)
-        
-        # Location row
-        location_layout = QHBoxLayout()
-        location_layout.setContentsMargins(0, 0, 0, 0)
-        
-        location_font_size = max(9, int(content_width * 0.028))  # 2.8% of width
-        
-        # Location icon (using text for now, can be replaced with actual icon)
-        location_icon = QLabel("📍")
-        location_icon.setFont(QFont("Arial", location_font_size))
-        location_icon.setFixedSize(max(16, int(content_width * 0.05)), max(16, int(content_width * 0.05)))
-        
-        location_label = QLabel(self.location)
-        location_label.setFont(QFont("Arial", 11))
-        location_label.setStyleSheet("color: #cccccc;")
-        
-        location_layout.addWidget(location_icon)
-        location_layout.addWidget(location_label)
-        location_layout.addStretch()
-        
-        content_layout.addLayout(location_layout)
-        
-        # Camera status row
-        camera_status_layout = QHBoxLayout()
-        camera_status_layout.setContentsMargins(0, 0, 0, 0)
-        
-        camera_status_label = QLabel("Camera:")
-        camera_status_label.setFont(QFont("Arial", 10))
-        camera_status_label.setStyleSheet("color: #cccccc;")
-        
-        camera_status_circle = QLabel()
-        camera_status_circle.setFixedSize(12, 12)
-        camera_status_circle.setStyleSheet(self.get_status_circle_style(self.camera_status))
-        
-        camera_status_text = QLabel(self.get_status_text(self.camera_status))
-        camera_status_text.setFont(QFont("Arial", 10))
-        camera_status_text.setStyleSheet("color: #ffffff; margin-left: 5px;")
-        
-        camera_status_layout.addWidget(camera_status_label)
-        camera_status_layout.addWidget(camera_status_circle)
-        camera_status_layout.addWidget(camera_status_text)
-        camera_status_layout.addStretch()
-        
-        content_layout.addLayout(camera_status_layout)
-        
-        # Parking status row
-        parking_status_layout = QHBoxLayout()
-        parking_status_layout.setContentsMargins(0, 0, 0, 0)
-        
-        parking_status_label = QLabel("Parking:")
-        parking_status_label.setFont(QFont("Arial", 10))
-        parking_status_label.setStyleSheet("color: #cccccc;")
-        
-        parking_status_circle = QLabel()
-        parking_status_circle.setFixedSize(12, 12)
-        parking_status_circle.setStyleSheet(self.get_parking_status_circle_style(self.parking_status))
-        
-        parking_status_text = QLabel(self.get_parking_status_text(self.parking_status))
-        parking_status_text.setFont(QFont("Arial", 10))
-        parking_status_text.setStyleSheet("color: #ffffff; margin-left: 5px;")
-        
-        parking_status_layout.addWidget(parking_status_label)
-        parking_status_layout.addWidget(parking_status_circle)
-        parking_status_layout.addWidget(parking_status_text)
-        parking_status_layout.addStretch()
-        
-        content_layout.addLayout(parking_status_layout)
-        
-        # Add click hint
-        click_hint = QLabel("Click to select camera")
-        click_hint.setFont(QFont("Arial", 9))
-        click_hint.setStyleSheet("""
-            color: #4a9eff;
-            font-style: italic;
-            text-align: center;
-            margin-top: 5px;
-        """)
-        click_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        content_layout.addWidget(click_hint)
-        
-        layout.addWidget(content_widget)
+logger = logging.getLogger(__name__)
+
+# Status indicator colors and labels painted by CamCardDelegate
+_CAMERA_STATUS_COLORS = {
+    CameraStatus.WORKING.value: "#00ff00",      # Green
+    CameraStatus.NOT_WORKING.value: "#ff0000",  # Red
+    CameraStatus.ERROR.value: "#ff9900"         # Orange
+}
+_PARKING_STATUS_COLORS = {
+    ParkingStatus.AVAILABLE.value: "#00ff00",    # Green
+    ParkingStatus.OCCUPIED.value: "#ff0000",     # Red
+    ParkingStatus.UNKNOWN.value: "#ff9900"       # Orange
+}
+_CAMERA_STATUS_TEXTS = {
+    CameraStatus.WORKING.value: "Working",
+    CameraStatus.NOT_WORKING.value: "Not Working",
+    CameraStatus.ERROR.value: "Error"
+}
+_PARKING_STATUS_TEXTS = {
+    ParkingStatus.AVAILABLE.value: "Available",
+    ParkingStatus.OCCUPIED.value: "Car Parking",
+    ParkingStatus.UNKNOWN.value: "Unknown"
+}
+_DEFAULT_STATUS_COLOR = "#9E9E9E"  # Default gray
+
+class CamCardModel(QAbstractListModel):
+    """List model exposing camera dictionaries to the card view"""
+    CameraRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, cameras=None, parent=None):
+        super().__init__(parent)
+        self.cameras = list(cameras or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.cameras)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.cameras):
+            return None
+        camera = self.cameras[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return camera.get("camera_name", "Unknown")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return "Click to select camera"
+        if role == self.CameraRole:
+            return camera
+        return None
+
+    def set_cameras(self, cameras):
+        """Replace the camera list, repainting only changed cards when the cameras are the same"""
+        cameras = list(cameras)
+        same_cameras = (len(cameras) == len(self.cameras) and
+                        all(new.get("camera_id") == old.get("camera_id")
+                            for new, old in zip(cameras, self.cameras)))
+        if not same_cameras:
+            self.beginResetModel()
+            self.cameras = cameras
+            self.endResetModel()
+            return
         
-    def load_image(self):
-        """Load camera image or show placeholder"""
-        # First try to load from saved image path
-        if self.image_path and os.path.exists(self.image_path):
-            try:
-                pixmap = QPixmap(self.image_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(314, 220, Qt.AspectRatioMode.KeepAspectRatioByExpanding, 
-                                                Qt.TransformationMode.SmoothTransformation)
-                    self.image_label.setPixmap(scaled_pixmap)
-                    print(f"✓ Successfully loaded image from {self.image_path}")
-                    return
-                else:
-                    print(f"✗ Failed to load image - pixmap is null: {self.image_path}")
-            except Exception as e:
-                print(f"✗ Error loading image from {self.image_path}: {e}")
+        old_cameras = self.cameras
+        self.cameras = cameras
+        for row, (new, old) in enumerate(zip(cameras, old_cameras)):
+            if new != old:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index)
+
+class CamCardDelegate(QStyledItemDelegate):
+    """Paints a camera card for each model row instead of building widgets"""
+    CONTAINER_SIZE = (314, 400)
+    IMAGE_HEIGHT = 220
+    BORDER = 3
+    RADIUS = 12
+
+    def __init__(self, card_size=(400, 480), parent=None):
+        super().__init__(parent)
+        self.card_size = card_size
+        self._failed_keys = set()  # cache keys of images that could not be decoded
+        self._name_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._id_font = QFont("Arial", 10)
+        self._location_font = QFont("Arial", 11)
+        self._status_font = QFont("Arial", 10)
+        self._hint_font = QFont("Arial", 9)
+        self._hint_font.setItalic(True)
+        self._placeholder_font = QFont("Arial")
+        self._placeholder_font.setPixelSize(24)
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_size[0], self.card_size[1])
+
+    def _get_pixmap(self, image_path):
+        """Get the scaled card image from QPixmapCache, decoding it on a miss"""
+        if not image_path:
+            return None
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        # Key on the file stamp so a rewritten image is decoded again
+        key = f"camcard:{image_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        if key in self._failed_keys:
+            return None
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        loaded = QPixmap(image_path)
+        if loaded.isNull():
+            logger.warning("Failed to load image, pixmap is null: %s", image_path)
+            self._failed_keys.add(key)
+            return None
+        pixmap = loaded.scaled(self.CONTAINER_SIZE[0], self.IMAGE_HEIGHT,
+                               Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                               Qt.TransformationMode.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paint(self, painter, option, index):
+        camera = index.data(CamCardModel.CameraRole)
+        if not camera:
+            return
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        width, height = self.CONTAINER_SIZE
+        container = QRect(0, 0, width, height)
+        container.moveCenter(option.rect.center())
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Container with rounded border, highlighted on hover
+        painter.setPen(QPen(QColor("#4a9eff" if hovered else "#2a2a2a"), self.BORDER))
+        painter.setBrush(QColor("#323232" if hovered else "#2a2a2a"))
+        painter.drawRoundedRect(QRectF(container), self.RADIUS, self.RADIUS)
+
+        inner = container.adjusted(self.BORDER, self.BORDER, -self.BORDER, -self.BORDER)
+        clip = QPainterPath()
+        clip.addRoundedRect(QRectF(inner), self.RADIUS - self.BORDER, self.RADIUS - self.BORDER)
+        painter.setClipPath(clip)
+
+        # Image section, cropped to fill the top of the card
+        image_rect = QRect(inner.left(), inner.top(), inner.width(), self.IMAGE_HEIGHT)
+        pixmap = self._get_pixmap(camera.get("image_path", camera.get("image", "")))
+        if pixmap is not None:
+            source = QRect(0, 0, image_rect.width(), image_rect.height())
+            source.moveCenter(pixmap.rect().center())
+            painter.drawPixmap(image_rect, pixmap, source)
         else:
-            print(f"✗ Image path not valid: {self.image_path}")
-        
-        # Show placeholder if image loading failed
-        print("Loading placeholder image...")
-        self.show_placeholder()
-    
-    def show_placeholder(self):
-        """Show placeholder when no image is available"""
-        self.image_label.setText("📷\nNo Image")
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border-top-left-radius: 9px;
-                border-top-right-radius: 9px;
-                border: none;
-                color: #ffffff;
-                font-size: 24px;
-            }
-        """)
-    
-    def get_status_circle_style(self, status):
-        """Get CSS style for camera status circle"""
-        colors = {
-            CameraStatus.WORKING.value: "#00ff00",      # Green
-            CameraStatus.NOT_WORKING.value: "#ff0000",  # Red
-            CameraStatus.ERROR.value: "#ff9900"         # Orange
-        }
-        color = colors.get(status, "#9E9E9E")  # Default gray
-        return f"""
-            QLabel {{
-                background-color: {color};
-                border-radius: 6px;
-                border: none;
-            }}
-        """
-    
-    def get_parking_status_circle_style(self, status):
-        """Get CSS style for parking status circle"""
-        colors = {
-            ParkingStatus.AVAILABLE.value: "#00ff00",    # Green
-            ParkingStatus.OCCUPIED.value: "#ff0000",     # Red
-            ParkingStatus.UNKNOWN.value: "#ff9900"       # Orange
-        }
-        color = colors.get(status, "#9E9E9E")  # Default gray
-        return f"""
-            QLabel {{
-                background-color: {color};
-                border-radius: 6px;
-                border: none;
-            }}
-        """
-    
-    def get_status_text(self, status):
-        """Get display text for camera status"""
-        texts = {
-            CameraStatus.WORKING.value: "Working",
-            CameraStatus.NOT_WORKING.value: "Not Working",
-            CameraStatus.ERROR.value: "Error"
-        }
-        return texts.get(status, "Unknown")
-    
-    def get_parking_status_text(self, status):
-        """Get display text for parking status"""
-        texts = {
-            ParkingStatus.AVAILABLE.value: "Available",
-            ParkingStatus.OCCUPIED.value: "Car Parking",
-            ParkingStatus.UNKNOWN.value: "Unknown"
-        }
-        return texts.get(status, "Unknown")
-    
-    def update_properties(self, camera_name=None, camera_id=None, location=None, 
-                         camera_status=None, parking_status=None, image_path=None):
-        """Update card properties and refresh display"""
-        if camera_name is not None:
-            self.camera_name = camera_name
-        if camera_id is not None:
-            self.camera_id = camera_id
-        if location is not None:
-            self.location = location
-        if camera_status is not None:
-            self.camera_status = camera_status
-        if parking_status is not None:
-            self.parking_status = parking_status
-        if image_path is not None:
-            self.image_path = image_path
-            
-        # Refresh the UI
-        self.refresh_ui()
-    
-    def refresh_ui(self):
-        """Refresh the UI with current properties"""
-        # Clear and recreate the UI
-        for i in reversed(range(self.layout().count())): 
-            self.layout().itemAt(i).widget().setParent(None)
-        self.init_ui()
-    
-    def mousePressEvent(self, event):
-        """Handle mouse click events"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.card_clicked.emit(self.camera_id)  # Emit signal with camera ID
-            print(f"Camera card clicked: {self.camera_name} ({self.camera_id})")
-        super().mousePressEvent(event)
-    
-    def enterEvent(self, event):
-        """Handle mouse enter events for hover effect"""
-        self.setStyleSheet("""
-            CamCard {
-                background-color: rgba(74, 158, 255, 0.1);
-            }
-        """)
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        """Handle mouse leave events"""
-        self.setStyleSheet("")  # Reset to default
-        super().leaveEvent(event)
+            painter.setPen(QColor("#ffffff"))
+            painter.setFont(self._placeholder_font)
+            painter.drawText(image_rect, Qt.AlignmentFlag.AlignCenter, "📷\nNo Image")
+
+        # Content section
+        content_rect = QRect(inner.left(), image_rect.bottom() + 1, inner.width(),
+                             inner.bottom() - image_rect.bottom())
+        painter.fillRect(content_rect, QColor("#1a1a1a"))
+        text_rect = content_rect.adjusted(12, 12, -12, -12)
+        row_height = text_rect.height() // 6
+        rows = [QRect(text_rect.left(), text_rect.top() + i * row_height, text_rect.width(), row_height)
+                for i in range(6)]
+
+        self._draw_name_row(painter, rows[0], camera)
+
+        painter.setFont(self._location_font)
+        painter.setPen(QColor("#cccccc"))
+        painter.drawText(rows[1], Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         f"📍 {camera.get('location', 'Unknown')}")
+
+        camera_status = camera.get("camera_status", CameraStatus.ERROR.value)
+        parking_status = camera.get("parking_status", ParkingStatus.UNKNOWN.value)
+        self._draw_status_row(painter, rows[2], "Camera:",
+                              _CAMERA_STATUS_COLORS.get(camera_status, _DEFAULT_STATUS_COLOR),
+                              _CAMERA_STATUS_TEXTS.get(camera_status, "Unknown"))
+        self._draw_status_row(painter, rows[3], "Parking:",
+                              _PARKING_STATUS_COLORS.get(parking_status, _DEFAULT_STATUS_COLOR),
+                              _PARKING_STATUS_TEXTS.get(parking_status, "Unknown"))
+
+        painter.setFont(self._hint_font)
+        painter.setPen(QColor("#4a9eff"))
+        hint_rect = rows[4].united(rows[5])
+        painter.drawText(hint_rect, Qt.AlignmentFlag.AlignCenter, "Click to select camera")
+
+        painter.restore()
+
+    def _draw_name_row(self, painter, rect, camera):
+        """Draw the centered camera name followed by its ID"""
+        name = camera.get("camera_name", "Unknown")
+        camera_id = f"#{camera.get('camera_id', '0')}"
+        name_width = QFontMetrics(self._name_font).horizontalAdvance(name)
+        id_width = QFontMetrics(self._id_font).horizontalAdvance(camera_id)
+        left = rect.left() + (rect.width() - name_width - 5 - id_width) // 2
+
+        painter.setFont(self._name_font)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(QRect(left, rect.top(), name_width, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, name)
+        painter.setFont(self._id_font)
+        painter.setPen(QColor("#cccccc"))
+        painter.drawText(QRect(left + name_width + 5, rect.top(), id_width, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, camera_id)
+
+    def _draw_status_row(self, painter, rect, label, color, text):
+        """Draw a status label, colored indicator circle and status text"""
+        painter.setFont(self._status_font)
+        metrics = QFontMetrics(self._status_font)
+        label_width = metrics.horizontalAdvance(label) + 6
+
+        painter.setPen(QColor("#cccccc"))
+        painter.drawText(QRect(rect.left(), rect.top(), label_width, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
+
+        circle = QRect(rect.left() + label_width, rect.center().y() - 6, 12, 12)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(circle)
+
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(QRect(circle.right() + 6, rect.top(), rect.right() - circle.right() - 6, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
 
 class CamCardFrame(QWidget):
     card_clicked = pyqtSignal(str)  # Signal emitted when a camera card is clicked
 
-    """Custom frame to hold CamCard with rounded corners"""
-    def __init__(self, cards_per_row=2, card_size=(400, 480)):
+    """Custom frame to hold camera cards in a virtualized view"""
+    def __init__(self, cards_per_row=2, card_size=(400, 480), cameras=None):
         super().__init__()
-        self.ROOT_DIR = os.path.abspath(os.curdir)
-        self.IMAGE_DIR = os.path.join(self.ROOT_DIR, "image")
-
         self.config_manager = CameraConfigManager()
 
-        self.cameras = self.config_manager.get_all_cameras()
+        # Callers that already hold the camera list pass it in to skip a config read
+        self.cameras = cameras if cameras is not None else self.config_manager.get_all_cameras()
         self.cards_per_row = cards_per_row
         self.card_size = card_size
 
         self.main_layout = QVBoxLayout(self)
-        self.scroll_area = QScrollArea()
+        self.card_model = CamCardModel(parent=self)
+        self.card_delegate = CamCardDelegate(card_size, parent=self)
+        self.card_view = QListView()
+        self.no_cameras_label = QLabel("No cameras configured.\nAdd cameras through the configuration menu.")
 
         self.init_ui()
 
@@ -372,16 +269,27 @@ class CamCardFrame(QWidget):
 
         self.main_layout.addWidget(label)
         
-        # Create scroll area for camera cards
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        # Set proper size policy for scroll area - remove minimum height restriction
-        from PyQt6.QtWidgets import QSizePolicy
-        self.scroll_area.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Card view: only the visible cards are painted, no widget per camera
+        self.card_view.setViewMode(QListView.ViewMode.IconMode)
+        self.card_view.setFlow(QListView.Flow.LeftToRight)
+        self.card_view.setWrapping(True)
+        self.card_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.card_view.setMovement(QListView.Movement.Static)
+        self.card_view.setUniformItemSizes(True)
+        self.card_view.setGridSize(QSize(self.card_size[0], self.card_size[1]))
+        self.card_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.card_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.card_view.setMouseTracking(True)
+        self.card_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.card_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.card_view.setModel(self.card_model)
+        self.card_view.setItemDelegate(self.card_delegate)
+        self.card_view.clicked.connect(self.on_card_index_clicked)
+        
+        # Set proper size policy for the view - remove minimum height restriction
+        self.card_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.card_view.setStyleSheet("""
+            QListView {
                 border: 1px solid #666666;
                 border-radius: 8px;
                 background-color: transparent;
@@ -414,104 +322,48 @@ class CamCardFrame(QWidget):
             }
         """)
         
+        # Message shown instead of a popup when no cameras exist
+        self.no_cameras_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_cameras_label.setStyleSheet("""
+            QLabel {
+                color: #888888;
+                font-size: 14px;
+                font-style: italic;
+                margin: 50px;
+                line-height: 1.5;
+            }
+        """)
+        
         # Add the camera cards
         self.add_camera_cards()
         
-        # Add scroll area to main layout
-        self.main_layout.addWidget(self.scroll_area, 1)
+        # Add view and placeholder to main layout
+        self.main_layout.addWidget(self.card_view, 1)
+        self.main_layout.addWidget(self.no_cameras_label, 1)
 
     def add_camera_cards(self):
-        """Add camera cards in a scrollable area with responsive centering"""
-        # Create content widget for cards (always create, even with no cameras)
-        content_widget = QWidget()
-        content_widget.setStyleSheet("QWidget { background-color: #1a1a1a; }")
-        from PyQt6.QtWidgets import QSizePolicy
-        content_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(20)
-        content_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignJustify)
-        
-        if not self.cameras:
-            # Create a message label instead of a popup when no cameras exist
-            no_cameras_label = QLabel("No cameras configured.\nAdd cameras through the configuration menu.")
-            no_cameras_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_cameras_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 14px;
-                    font-style: italic;
-                    margin: 50px;
-                    line-height: 1.5;
-                }
-            """)
-            content_layout.addWidget(no_cameras_label)
-            # Set the scroll area content and return early
-            self.scroll_area.setWidget(content_widget)
-            return
+        """Load the camera list into the card model"""
+        self.card_model.set_cameras(self.cameras)
         
-        # Create rows for cards
-        current_row_layout = None
-        
-        for i, camera_data in enumerate(self.cameras):
-            # Create new row layout if needed
-            if i % self.cards_per_row == 0:
-                current_row_layout = QHBoxLayout()
-                current_row_layout.setSpacing(30)
-                content_layout.addLayout(current_row_layout)
-            
-            # Create camera card
-            print(f"Creating camera card: {camera_data['camera_name']} ({camera_data['camera_id']})")
-            card = CamCard(
-                camera_name=camera_data["camera_name"],
-                camera_id=camera_data["camera_id"],
-                location=camera_data["location"],
-                camera_status=camera_data["camera_status"],
-                parking_status=camera_data["parking_status"],
-                video_source=camera_data["video_source"],
-                image_path=camera_data.get("image_path", ""),  # Pass the image path
-                card_size=self.card_size
-            )
-            
-            # Connect card click signal
-            card.card_clicked.connect(self.on_camera_card_clicked)
-            
-            # Add card to current row
-            print(f"Adding camera card to layout: {camera_data['camera_name']}")
-            current_row_layout.addWidget(card)
-        
-        # Handle centering in last row
-        card_count = len(self.cameras)
-        remaining = card_count % self.cards_per_row
-        if remaining != 0 and current_row_layout:
-            # Add stretch before first widget
-            current_row_layout.insertStretch(0, 1)
-            # Add stretch after last widget
-            current_row_layout.addStretch(1)
-
-        # Optional: center vertically if only one card total
-        if card_count == 1:
-            content_layout.insertStretch(0, 1)  # Top
-            content_layout.addStretch(1)       # Bottom
-
-        # Set the scroll area content
-        self.scroll_area.setWidget(content_widget)  
-
-    def update_camera_cards(self):
-        """Update camera cards with latest data"""
-        self.config_manager.load_config()
-        self.cameras = self.config_manager.get_all_cameras()
-        
-        # Clear existing cards if widget exists
-        if self.scroll_area.widget() and self.scroll_area.widget().layout():
-            for i in reversed(range(self.scroll_area.widget().layout().count())):
-                item = self.scroll_area.widget().layout().itemAt(i)
-                if item.widget():
-                    item.widget().setParent(None)
-        
-        # Re-add camera cards
+        has_cameras = bool(self.cameras)
+        self.card_view.setVisible(has_cameras)
+        self.no_cameras_label.setVisible(not has_cameras)
+
+    def update_camera_cards(self, cameras=None):
+        """Update camera cards with latest data, or with the given camera list"""
+        if cameras is None:
+            self.config_manager.load_config()
+            cameras = self.config_manager.get_all_cameras()
+        self.cameras = cameras
         self.add_camera_cards()
 
+    def on_card_index_clicked(self, index):
+        """Translate a clicked view index into a camera card click"""
+        camera = index.data(CamCardModel.CameraRole)
+        if camera:
+            self.on_camera_card_clicked(camera.get("camera_id"))
+
     def on_camera_card_clicked(self, camera_id):
         """Handle camera card click events"""
-        print(f"CamCardFrame: Camera card clicked: {camera_id}")
-        self.card_clicked.emit(camera_id)
\ No newline at end of file
+        logger.debug("Camera card clicked: %s", camera_id)
+        self.card_clicked.emit(camera_id)
@@ -1,8 +1,19 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QMessageBox, QButtonGroup, QFrame, QSizePolicy, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel, QMessageBox,
+                             QListView, QAbstractItemView, QStyledItemDelegate, QStyle)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont
 from src.enums import CameraStatus
 from src.config.utils import CameraConfigManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Status circle colors shared by the toggle button and the list delegate
+_STATUS_COLORS = {
+    CameraStatus.WORKING.value: QColor("#00ff00"),    # Green
+    CameraStatus.NOT_WORKING.value: QColor("#ff0000"),   # Red
+    CameraStatus.ERROR.value: QColor("#ff9900")      # Orange
+}
 
 class CameraToggleButton(QPushButton):
     def __init__(self, camera_id, camera_name, status=CameraStatus.NOT_WORKING.value, parent=None):
@@ -52,13 +63,7 @@ class CameraToggleButton(QPushButton):
         circle_y = self.height() // 2 - 6  # Center vertically
         circle_radius = 6
         
-        status_colors = {
-            CameraStatus.WORKING.value: QColor("#00ff00"),    # Green
-            CameraStatus.NOT_WORKING.value: QColor("#ff0000"),   # Red
-            CameraStatus.ERROR.value: QColor("#ff9900")      # Orange
-        }
-        
-        status_color = status_colors.get(self.status, QColor("#9E9E9E"))  # Default gray
+        status_color = _STATUS_COLORS.get(self.status, QColor("#9E9E9E"))  # Default gray
         painter.setBrush(status_color)
         painter.setPen(QPen(status_color))
         painter.drawEllipse(circle_x, circle_y, circle_radius * 2, circle_radius * 2)
@@ -81,6 +86,114 @@ class CameraToggleButton(QPushButton):
             "camera_status": self.status
         }
 
+class CameraListModel(QAbstractListModel):
+    """List model of (camera id, name, status) rows for the camera selector"""
+    StatusRole = Qt.ItemDataRole.UserRole + 1
+    CameraRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # [camera_id, camera_name, status] per camera
+        self.name_to_row = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.rows):
+            return None
+        camera_id, camera_name, status = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return camera_name
+        if role == self.StatusRole:
+            return status
+        if role == self.CameraRole:
+            return {
+                "camera_id": camera_id,
+                "camera_name": camera_name,
+                "camera_status": status
+            }
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != self.StatusRole or not index.isValid():
+            return False
+        row = self.rows[index.row()]
+        if row[2] != value:
+            row[2] = value
+            # Only this row is repainted
+            self.dataChanged.emit(index, index, [role])
+        return True
+
+    def set_cameras(self, cameras):
+        """Replace all rows from camera configuration dictionaries"""
+        self.beginResetModel()
+        self.rows = []
+        self.name_to_row = {}
+        for i, camera in enumerate(cameras):
+            camera_name = camera.get('camera_name', f"Camera {i + 1}")
+            self.rows.append([
+                camera.get('camera_id', f"cam_{i + 1}"),
+                camera_name,
+                camera.get('camera_status', CameraStatus.NOT_WORKING.value)
+            ])
+            self.name_to_row.setdefault(camera_name, i)
+        self.endResetModel()
+
+    def index_of(self, camera_name):
+        """Get the model index of the first camera with this name (invalid if missing)"""
+        row = self.name_to_row.get(camera_name)
+        return self.index(row, 0) if row is not None else QModelIndex()
+
+class CameraListDelegate(QStyledItemDelegate):
+    """Paints each camera row as a pill button with a status circle"""
+    PILL_SIZE = (500, 40)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont()
+        self._font.setPixelSize(14)
+        self._font.setWeight(QFont.Weight.Medium)
+
+    def sizeHint(self, option, index):
+        return QSize(self.PILL_SIZE[0], self.PILL_SIZE[1])
+
+    def paint(self, painter, option, index):
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        pill = QRect(0, 0, self.PILL_SIZE[0], self.PILL_SIZE[1])
+        pill.moveCenter(option.rect.center())
+
+        # Same palette as the CameraToggleButton stylesheet
+        if selected:
+            background = "#3a8eef" if hovered else "#4a9eff"
+            border = "#3a8eef"
+        else:
+            background = "#3a3a3a" if hovered else "#2a2a2a"
+            border = "#4a9eff" if hovered else "#666666"
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(pill).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        painter.setFont(self._font)
+        painter.setPen(QColor("#ffffff"))
+        text_rect = pill.adjusted(16, 0, -50, 0)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         index.data(Qt.ItemDataRole.DisplayRole))
+
+        # Status circle on the right
+        status_color = _STATUS_COLORS.get(index.data(CameraListModel.StatusRole), QColor("#9E9E9E"))
+        painter.setBrush(status_color)
+        painter.setPen(QPen(status_color))
+        painter.drawEllipse(pill.right() + 1 - 30, pill.center().y() - 6, 12, 12)
+        painter.restore()
+
 class CameraSelector(QWidget):
     camera_selected = pyqtSignal(dict)  # Signal to emit when camera selection changes
     camera_changed = pyqtSignal(str)  # Signal to emit when camera is toggled
@@ -92,9 +205,7 @@ class CameraSelector(QWidget):
         cameras = self.config_manager.get_all_cameras()
 
         self.cameras = cameras if cameras else []
-        self.toggle_buttons = []
-        self.button_group = QButtonGroup(self)
-        self.button_group.setExclusive(True)
+        self.camera_model = CameraListModel(self)
         self.selected_camera = None
         self.init_ui()
 
@@ -116,37 +227,23 @@ class CameraSelector(QWidget):
         """)
         layout.addWidget(label)
 
-        # Create scroll area for camera buttons
-        self.scroll_area = QScrollArea()  # Store reference to scroll area
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        # Set a maximum height to force scrolling when there are many cameras
-        # Each button is 40px + 10px spacing, so calculate based on actual vs max cameras
-        max_visible_cameras = 2.5  # Show 2.5 cameras to hint at more content below
-        button_height = 40
-        button_spacing = 10
-        margins = 20  # Top and bottom margins
-        
-        # Use the smaller of actual cameras or max visible cameras for height calculation
-        visible_cameras = min(len(self.cameras), max_visible_cameras)
-        if visible_cameras == 0:
-            visible_cameras = 1  # Minimum height for empty state
-            
-        max_height = int((visible_cameras * (button_height + button_spacing)) + margins)
-        self.scroll_area.setMaximumHeight(max_height)
-        self.scroll_area.setMinimumHeight(max_height)  # Also set minimum to prevent extra space
-        
-        # Only show vertical scrollbar if more than 2 cameras
-        if len(self.cameras) > 2:
-            self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        else:
-            self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Create list view for cameras: one painted row per camera, no widget per camera
+        self.camera_view = QListView()
+        self.camera_view.setModel(self.camera_model)
+        self.camera_view.setItemDelegate(CameraListDelegate(self.camera_view))
+        self.camera_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.camera_view.setUniformItemSizes(True)
+        self.camera_view.setSpacing(5)  # 10px between rows, like the old button layout
+        self.camera_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.camera_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.camera_view.setMouseTracking(True)
+        self.camera_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.camera_view.setStyleSheet("""
+            QListView {
                 border: none;
                 background-color: transparent;
+                padding: 5px;
+                outline: none;
             }
             QScrollBar:vertical {
                 background-color: #2a2a2a;
@@ -172,41 +269,13 @@ class CameraSelector(QWidget):
                 background: none;
             }
         """)
-
-        # Create a widget to hold the buttons
-        self.scroll_widget = QWidget()
-        self.scroll_area.setWidget(self.scroll_widget)
-        
-        # Create vertical layout for toggle buttons and store reference
-        self.buttons_layout = QVBoxLayout(self.scroll_widget)
-        self.buttons_layout.setSpacing(10)  # Space between buttons
-        self.buttons_layout.setContentsMargins(10, 10, 10, 10)
-        self.buttons_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
         
-        # Create toggle buttons for each camera
-        for i, camera in enumerate(self.cameras):
-            status = camera.get('camera_status', CameraStatus.NOT_WORKING.value)
-            camera_name = camera.get('camera_name', f"Camera {i + 1}")
-            camera_id = camera.get('camera_id', f"cam_{i + 1}")
-            
-            toggle_button = CameraToggleButton(camera_id=camera_id, camera_name=camera_name, status=status)
-            
-            # Set the first camera as selected by default
-            if i == 0:
-                toggle_button.setChecked(True)
-            
-            # Connect signal to emit camera change
-            toggle_button.toggled.connect(lambda checked, cam=camera.get("camera_name", "Unknown"): self.on_camera_changed(checked, cam))
-            
-            self.toggle_buttons.append(toggle_button)
-            self.button_group.addButton(toggle_button)
-            self.buttons_layout.addWidget(toggle_button, 0, Qt.AlignmentFlag.AlignHCenter)
-        
-        # Add stretch to keep buttons at top
-        self.buttons_layout.addStretch()
+        # Fill the model, select the first camera and size the view
+        self.recreate_buttons()
+        self.camera_view.selectionModel().currentChanged.connect(self.on_current_camera_changed)
         
-        # Add the scroll area to the main layout
-        layout.addWidget(self.scroll_area, 1)  # Give it stretch factor of 1
+        # Add the list view to the main layout
+        layout.addWidget(self.camera_view, 1)  # Give it stretch factor of 1
 
         config_button = QPushButton("Config Selected Camera!")
         config_button.setFixedSize(250, 50)
@@ -231,95 +300,84 @@ class CameraSelector(QWidget):
         config_button.clicked.connect(self.on_config_button_clicked)
         layout.addWidget(config_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
+    def _update_view_height(self):
+        """Size the list to show at most 2.5 cameras, hinting at more content below"""
+        max_visible_cameras = 2.5
+        button_height = 40
+        button_spacing = 10
+        margins = 20  # Top and bottom margins
+        
+        # Use the smaller of actual cameras or max visible cameras for height calculation
+        visible_cameras = min(len(self.cameras), max_visible_cameras)
+        if visible_cameras == 0:
+            visible_cameras = 1  # Minimum height for empty state
+            
+        max_height = int((visible_cameras * (button_height + button_spacing)) + margins)
+        self.camera_view.setMaximumHeight(max_height)
+        self.camera_view.setMinimumHeight(max_height)  # Also set minimum to prevent extra space
+        
+        # Only show vertical scrollbar if more than 2 cameras
+        if len(self.cameras) > 2:
+            self.camera_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        else:
+            self.camera_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+    def on_current_camera_changed(self, current, previous):
+        """Emit camera_changed when a different camera becomes selected"""
+        if current.isValid():
+            self.on_camera_changed(True, current.data(Qt.ItemDataRole.DisplayRole))
+
     def on_camera_changed(self, checked, camera):
         """Handle camera selection change"""
         if checked:
             self.camera_changed.emit(camera)
             # Auto-scroll to the selected camera
-            for toggle_button in self.toggle_buttons:
-                if toggle_button.get_camera_name() == camera and toggle_button.isChecked():
-                    self.scroll_to_selected_camera(toggle_button)
-                    break
+            self.scroll_to_selected_camera(self.camera_view.currentIndex())
 
     def get_selected_camera(self):
         """Get the currently selected camera"""
-        for toggle_button in self.toggle_buttons:
-            if toggle_button.isChecked():
-                return toggle_button.get_camera()
+        index = self.camera_view.currentIndex()
+        if index.isValid():
+            return index.data(CameraListModel.CameraRole)
         return None
 
     def set_selected_camera(self, camera_name):
         """Programmatically select a camera"""
-        for toggle_button in self.toggle_buttons:
-            if toggle_button.get_camera_name() == camera_name:
-                toggle_button.setChecked(True)
-                self.scroll_to_selected_camera(toggle_button)
-                break
+        index = self.camera_model.index_of(camera_name)
+        if index.isValid():
+            self.camera_view.setCurrentIndex(index)
+            self.scroll_to_selected_camera(index)
 
-    def scroll_to_selected_camera(self, selected_button):
+    def scroll_to_selected_camera(self, index):
         """Automatically scroll to make the selected camera visible"""
-        if not hasattr(self, 'scroll_area') or not selected_button:
-            return
-        
-        # Use QTimer to ensure the UI is updated before scrolling
-        QTimer.singleShot(10, lambda: self._perform_scroll_to_button(selected_button))
-    
-    def _perform_scroll_to_button(self, selected_button):
-        """Perform the actual scrolling to the button"""
-        if not selected_button or not hasattr(self, 'scroll_area'):
+        if not index.isValid():
             return
-            
-        # Ensure the widget has been properly laid out
-        self.scroll_widget.updateGeometry()
-        
-        # Get the button's position relative to the scroll widget
-        button_pos = selected_button.pos()
-        button_height = selected_button.height()
-        
-        # Get scroll area dimensions
-        scroll_area_height = self.scroll_area.viewport().height()
-        
-        # Calculate the desired scroll position to center the button
-        desired_scroll_pos = button_pos.y() - (scroll_area_height // 2) + (button_height // 2)
-        
-        # Ensure the scroll position is within valid bounds
-        scroll_bar = self.scroll_area.verticalScrollBar()
-        max_scroll = scroll_bar.maximum()
-        min_scroll = scroll_bar.minimum()
-        
-        # Clamp the desired position to valid range
-        final_scroll_pos = max(min_scroll, min(desired_scroll_pos, max_scroll))
-        
-        # Smoothly scroll to the position
-        scroll_bar.setValue(final_scroll_pos)
-        
-        print(f"[CameraSelector] Auto-scrolled to camera: {selected_button.get_camera_name()}")
+        self.camera_view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
 
     def update_camera_status(self, camera_name, status):
         """Update the status of a specific camera"""
-        for toggle_button in self.toggle_buttons:
-            if toggle_button.get_camera_name() == camera_name:
-                toggle_button.set_status(status)
-                break
+        index = self.camera_model.index_of(camera_name)
+        if index.isValid():
+            self.camera_model.setData(index, status, CameraListModel.StatusRole)
 
     def update_camera_statuses(self):
         """Refresh camera data from JSON configuration and update UI"""
         # Reload configuration from file
-        print("[CameraSelector] Updating Cameras Statuses")
+        logger.debug("Updating camera statuses")
         self.config_manager.load_config()
         cameras = self.config_manager.get_all_cameras()
         
-        print(f"[CameraSelector] Loaded {len(cameras)} cameras from config")
+        logger.debug("Loaded %d cameras from config", len(cameras))
         
         # Store current selection to restore it
         current_selection = self.get_selected_camera()
         current_selection_name = current_selection.get('camera_name') if current_selection else None
-        print(f"[CameraSelector] Current selection: {current_selection_name}")
+        logger.debug("Current selection: %s", current_selection_name)
         
         # Update internal data - store full camera objects, not just names
         self.cameras = cameras if cameras else []
         
-        # Just recreate the buttons without touching the layout
+        # Just recreate the rows without touching the layout
         self.recreate_buttons()
         
         # Restore selection if possible
@@ -331,10 +389,7 @@ class CameraSelector(QWidget):
 
     def get_all_camera_statuses(self):
         """Get all camera statuses as a dictionary"""
-        statuses = {}
-        for toggle_button in self.toggle_buttons:
-            statuses[toggle_button.get_camera_name()] = toggle_button.status
-        return statuses
+        return {camera_name: status for _, camera_name, status in self.camera_model.rows}
     
     def on_config_button_clicked(self):
         """Handle the configuration button click"""
@@ -346,93 +401,26 @@ class CameraSelector(QWidget):
             QMessageBox.warning(self, "No Camera Selected", "Please select a camera to configure.")
 
     def recreate_buttons(self):
-        """Recreate only the camera buttons without touching the main layout"""
-        print(f"[CameraSelector] recreate_buttons called with {len(self.cameras)} cameras")
-        
-        if not hasattr(self, 'buttons_layout'):
-            print("[CameraSelector] ERROR: buttons_layout not found!")
-            return
-            
-        # Clear existing buttons
-        self.clear_buttons_only(self.buttons_layout)
-        
-        # Update scroll area policy based on camera count
-        if hasattr(self, 'scroll_area'):
-            # Update maximum height based on camera count
-            max_visible_cameras = 2.5  # Show 2.5 cameras to hint at more content below
-            button_height = 40
-            button_spacing = 10
-            margins = 20  # Top and bottom margins
-            
-            # Use the smaller of actual cameras or max visible cameras for height calculation
-            visible_cameras = min(len(self.cameras), max_visible_cameras)
-            if visible_cameras == 0:
-                visible_cameras = 1  # Minimum height for empty state
-                
-            max_height = int((visible_cameras * (button_height + button_spacing)) + margins)
-            self.scroll_area.setMaximumHeight(max_height)
-            self.scroll_area.setMinimumHeight(max_height)  # Also set minimum to prevent extra space
-            
-            if len(self.cameras) > 2:
-                self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            else:
-                self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        # Create new buttons
-        for i, camera in enumerate(self.cameras):
-            status = camera.get('camera_status', CameraStatus.NOT_WORKING.value)
-            camera_name = camera.get('camera_name', f"Camera {i + 1}")
-            camera_id = camera.get('camera_id', f"cam_{i + 1}")
-            
-            print(f"[CameraSelector] Creating button for: {camera_name} ({camera_id})")
-            
-            toggle_button = CameraToggleButton(camera_id=camera_id, camera_name=camera_name, status=status)
+        """Reload the camera rows from self.cameras without touching the main layout"""
+        logger.debug("recreate_buttons called with %d cameras", len(self.cameras))
+        
+        # Reset the model quietly, the caller restores the selection it wants
+        self.camera_view.blockSignals(True)
+        selection_model = self.camera_view.selectionModel()
+        if selection_model is not None:
+            selection_model.blockSignals(True)
+        try:
+            self.camera_model.set_cameras(self.cameras)
             
             # Set the first camera as selected by default
-            if i == 0:
-                toggle_button.setChecked(True)
-            
-            # Connect signal to emit camera change
-            toggle_button.toggled.connect(lambda checked, cam=camera_name: self.on_camera_changed(checked, cam))
-            
-            self.toggle_buttons.append(toggle_button)
-            self.button_group.addButton(toggle_button)
-            self.buttons_layout.addWidget(toggle_button, 0, Qt.AlignmentFlag.AlignHCenter)
-            
-            print(f"[CameraSelector] Added button to layout: {camera_name}")
-        
-        # Add stretch to keep buttons at top
-        self.buttons_layout.addStretch()
-        
-        print(f"[CameraSelector] Total buttons created: {len(self.toggle_buttons)}")
-
-    def clear_buttons_only(self, buttons_layout):
-        """Clear only the camera buttons from the buttons layout"""
-        print(f"[CameraSelector] Clearing {len(self.toggle_buttons)} existing buttons")
-        
-        # Disconnect signals first
-        for button in self.toggle_buttons:
-            try:
-                button.toggled.disconnect()
-            except:
-                pass
-        
-        # Clear the button group
-        if hasattr(self, 'button_group'):
-            self.button_group.setExclusive(False)
-            for button in self.button_group.buttons():
-                self.button_group.removeButton(button)
-        
-        # Remove widgets from the buttons layout
-        while buttons_layout.count():
-            child = buttons_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
-                child.widget().deleteLater()
+            if self.cameras:
+                self.camera_view.setCurrentIndex(self.camera_model.index(0, 0))
+        finally:
+            if selection_model is not None:
+                selection_model.blockSignals(False)
+            self.camera_view.blockSignals(False)
         
-        # Clear the buttons list and recreate button group
-        self.toggle_buttons = []
-        self.button_group = QButtonGroup(self)
-        self.button_group.setExclusive(True)
+        # Update list height and scrollbar policy based on camera count
+        self._update_view_height()
         
-        print("[CameraSelector] Buttons cleared successfully")
\ No newline at end of file
+        logger.debug("Total rows created: %d", self.camera_model.rowCount())
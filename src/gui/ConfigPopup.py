@@ -1,15 +1,41 @@
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QHBoxLayout, QDialog, QDialogButtonBox, QLabel, 
+    QVBoxLayout, QDialog, QDialogButtonBox, QLabel, 
     QPushButton, QListWidget, QLineEdit, QSpinBox, QGroupBox,
     QFormLayout, QWidget, QSplitter, QMessageBox, QListWidgetItem
 )
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal
+from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThreadPool, QRegularExpression
+from PyQt6.QtGui import QRegularExpressionValidator
 from src.config.utils import CameraConfigManager
+from src.gui.workers import FunctionWorker
 from datetime import datetime
-from random import randint
 from src.enums import CameraStatus, ParkingStatus
-import os
-import shutil
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# (attribute, config key, label, placeholder, mode) for each row of the camera form
+_FIELDS = [
+    ('camera_name_edit', 'camera_name', 'Camera Name:', 'Enter camera name', None),
+    ('location_edit', 'location', 'Location:', 'Enter camera location', None),
+    ('ip_address_edit', 'ip_address', 'IP Address:', '192.168.1.100', None),
+    ('port_spin', 'port', 'Port:', None, 'port'),
+    ('username_edit', 'username', 'Username:', 'Enter username', None),
+    ('password_edit', 'password', 'Password:', 'Enter password', 'password'),
+    ('video_source_edit', 'video_source', 'Video Source:', 'rtsp://... or 0 for webcam', None),
+]
+
+# IP address pattern, one group per octet. Compiled once and shared by every dialog
+_IP_PATTERN = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
+_IP_RE = re.compile(_IP_PATTERN)
+_IP_VALIDATOR = QRegularExpressionValidator(QRegularExpression(_IP_PATTERN))
+
+# Preformatted ids for the common case, larger numbers fall back to formatting
+_CAM_IDS = [f"CAM_{i:03d}" for i in range(1000)]
+
+def _camera_id(number):
+    """Get the CAM_nnn id for a camera number"""
+    return _CAM_IDS[number] if number < 1000 else f"CAM_{number:03d}"
 
 class ConfigPopup(QDialog):
     # Signal to notify when configuration changes are made
@@ -28,10 +54,40 @@ class ConfigPopup(QDialog):
         # Track current mode and camera being edited
         self.current_mode = None  # "add" or "edit"
         self.current_camera_id = None  # ID of camera being edited, None for new
+        self._default_new_camera_name = None  # Name prefilled by add_camera
         
         # Track if changes were made during this session
         self.changes_made = False
         
+        # Coalesce bursts of selection changes (e.g. keyboard navigation) into one form update
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(50)
+        self._sel_timer.timeout.connect(self._apply_selection)
+        
+        # Whether a camera is selected, and the last enabled state pushed to the selection-dependent buttons
+        self._has_selection = False
+        self._action_buttons_enabled = False  # delete button starts disabled
+        
+        # Running save worker and the (mode, camera_id, camera_name, session) it was started for
+        self._save_worker = None
+        self._pending_save = None
+        
+        # Bumped each time a reused dialog is reopened, tells a save which session started it
+        self._session = 0
+        
+        # List item per camera_id, kept in step with camera_list
+        self._camera_items = {}
+        
+        # Auto-dismissing success message, created on first use
+        self._toast = None
+        self._toast_timer = None
+        
+        # Form widgets are built on first use, see _ensure_config_panel
+        for attr, _, _, _, _ in _FIELDS:
+            setattr(self, attr, None)
+        self._fields = None
+        
         # Setup UI
         self.setup_ui()
         self.load_cameras()
@@ -47,9 +103,13 @@ class ConfigPopup(QDialog):
         left_panel = self.create_camera_list_panel()
         splitter.addWidget(left_panel)
         
-        # Right panel - Camera configuration
-        right_panel = self.create_camera_config_panel()
-        splitter.addWidget(right_panel)
+        # Right panel - Camera configuration, filled in once a camera is selected or added
+        self._config_panel = QWidget()
+        placeholder_layout = QVBoxLayout()
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        placeholder_layout.addWidget(QLabel("Select a camera or add a new one"), 0, Qt.AlignmentFlag.AlignCenter)
+        self._config_panel.setLayout(placeholder_layout)
+        splitter.addWidget(self._config_panel)
         
         # Set splitter proportions
         splitter.setStretchFactor(0, 1)  # Camera list takes 1/3
@@ -68,6 +128,7 @@ class ConfigPopup(QDialog):
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
         self.buttonBox.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self.apply_changes)
+        self.update_apply_button()
         
         main_layout.addWidget(self.buttonBox)
         self.setLayout(main_layout)
@@ -118,42 +179,18 @@ class ConfigPopup(QDialog):
         config_group = QGroupBox("Camera Properties")
         form_layout = QFormLayout()
         
-        # Camera Name
-        self.camera_name_edit = QLineEdit()
-        self.camera_name_edit.setPlaceholderText("Enter camera name")
-        form_layout.addRow("Camera Name:", self.camera_name_edit)
-        
-        # Location
-        self.location_edit = QLineEdit()
-        self.location_edit.setPlaceholderText("Enter camera location")
-        form_layout.addRow("Location:", self.location_edit)
-        
-        # IP Address
-        self.ip_address_edit = QLineEdit()
-        self.ip_address_edit.setPlaceholderText("192.168.1.100")
-        form_layout.addRow("IP Address:", self.ip_address_edit)
-        
-        # Port
-        self.port_spin = QSpinBox()
-        self.port_spin.setRange(1, 65535)
-        self.port_spin.setValue(8080)
-        form_layout.addRow("Port:", self.port_spin)
-        
-        # Username
-        self.username_edit = QLineEdit()
-        self.username_edit.setPlaceholderText("Enter username")
-        form_layout.addRow("Username:", self.username_edit)
-        
-        # Password
-        self.password_edit = QLineEdit()
-        self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_edit.setPlaceholderText("Enter password")
-        form_layout.addRow("Password:", self.password_edit)
-        
-        # Video Source
-        self.video_source_edit = QLineEdit()
-        self.video_source_edit.setPlaceholderText("rtsp://... or 0 for webcam")
-        form_layout.addRow("Video Source:", self.video_source_edit)
+        # (config key, getter, setter, default) per field, drives the form read/write loops
+        fields = []
+        for attr, key, label, placeholder, mode in _FIELDS:
+            widget = self.create_form_field(placeholder, mode)
+            setattr(self, attr, widget)
+            form_layout.addRow(label, widget)
+            if mode == 'port':
+                fields.append((key, widget.value, widget.setValue, 8080))
+            else:
+                fields.append((key, lambda widget=widget: widget.text().strip(), widget.setText, ''))
+        self._fields = fields
+        self.ip_address_edit.setValidator(_IP_VALIDATOR)
         
         config_group.setLayout(form_layout)
         layout.addWidget(config_group)
@@ -163,96 +200,193 @@ class ConfigPopup(QDialog):
         
         panel.setLayout(layout)
         return panel
+    
+    def _ensure_config_panel(self):
+        """Build the configuration form the first time it is needed"""
+        if self.camera_name_edit is not None:
+            return
+            
+        layout = self._config_panel.layout()
+        layout.itemAt(0).widget().hide()
+        layout.addWidget(self.create_camera_config_panel())
+        
+    def create_form_field(self, placeholder, mode):
+        """Create a single form widget from its field spec"""
+        if mode == 'port':
+            widget = QSpinBox()
+            widget.setRange(1, 65535)
+            widget.setValue(8080)
+            return widget
+        
+        widget = QLineEdit()
+        widget.setPlaceholderText(placeholder)
+        if mode == 'password':
+            widget.setEchoMode(QLineEdit.EchoMode.Password)
+        return widget
         
     def load_cameras(self):
         """Load cameras from configuration into the list"""
-        self.camera_list.clear()
+        current_item = self.camera_list.currentItem()
+        current_id = current_item.data(Qt.ItemDataRole.UserRole).get('camera_id') if current_item else None
         
+        # Repaint and report selection once for the whole batch, not per item
+        self.camera_list.setUpdatesEnabled(False)
+        self.camera_list.blockSignals(True)
         try:
+            self.camera_list.clear()
+            self._camera_items.clear()
             cameras = self.camera_manager.get_all_cameras()
-            for camera in cameras:
-                camera_id = camera.get('camera_id', 'Unknown')
-                camera_name = camera.get('camera_name', 'Unnamed Camera')
-                
-                item = QListWidgetItem(f"{camera_name} ({camera_id})")
-                item.setData(Qt.ItemDataRole.UserRole, camera)
+            items = [self._create_camera_item(camera) for camera in cameras]
+            for item in items:
                 self.camera_list.addItem(item)
                 
+            # Keep the previously selected camera selected if it is still there
+            if current_id is not None:
+                self.camera_list.setCurrentRow(self._find_camera_row(current_id))
+                
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load cameras: {str(e)}")
+        finally:
+            self.camera_list.blockSignals(False)
+            self.camera_list.setUpdatesEnabled(True)
+            
+        if current_id is not None:
+            self.on_camera_selected()
+            
+    def _create_camera_item(self, camera):
+        """Create the list item for a camera"""
+        item = QListWidgetItem(self.camera_manager.get_display_label(camera))
+        item.setData(Qt.ItemDataRole.UserRole, camera)
+        self._camera_items.setdefault(camera.get('camera_id'), item)
+        return item
+        
+    def _append_camera_item(self, camera):
+        """Add a list item for a camera and return it"""
+        item = self._create_camera_item(camera)
+        self.camera_list.addItem(item)
+        self.camera_list.viewport().update()
+        return item
+        
+    def _update_camera_item(self, row, camera):
+        """Refresh the list item at row with new camera data"""
+        item = self.camera_list.item(row)
+        old_camera = item.data(Qt.ItemDataRole.UserRole)
+        if old_camera == camera:
+            return
+            
+        # Data always changes on save, the visible text only when the name does
+        item.setData(Qt.ItemDataRole.UserRole, camera)
+        if old_camera is None or old_camera.get('camera_name') != camera.get('camera_name'):
+            item.setText(self.camera_manager.get_display_label(camera))
+            self.camera_list.viewport().update()
+        
+    def _find_camera_row(self, camera_id):
+        """Get the list row showing camera_id, or -1 if it is not listed"""
+        item = self._camera_items.get(camera_id)
+        return self.camera_list.row(item) if item is not None else -1
             
     def on_camera_selected(self):
         """Handle camera selection in the list"""
+        self._sel_timer.start()
+    
+    def _apply_selection(self):
+        """Update the form and mode for the current list selection"""
         current_item = self.camera_list.currentItem()
+        self.set_action_buttons_enabled(current_item is not None)
         
         if current_item:
             camera_data = current_item.data(Qt.ItemDataRole.UserRole)
+            self._ensure_config_panel()
             self.populate_camera_form(camera_data)
-            self.delete_button.setEnabled(True)
 
             # Set edit mode
             self.current_mode = "edit"
             self.current_camera_id = camera_data.get('camera_id')
+            self._default_new_camera_name = None
         else:
             self.clear_camera_form()
-            self.delete_button.setEnabled(False)
             
             # Clear mode when no selection
             self.current_mode = None
             self.current_camera_id = None
+            self._default_new_camera_name = None
+        self.update_apply_button()
+            
+    def update_apply_button(self):
+        """Enable Apply only while adding or editing and no save is running"""
+        self.buttonBox.button(QDialogButtonBox.StandardButton.Apply).setEnabled(
+            self.current_mode is not None and self._save_worker is None
+        )
+        self._sync_action_buttons()
+        
+    def set_action_buttons_enabled(self, enabled):
+        """Enable or disable the selection-dependent buttons, they stay disabled while a save runs"""
+        self._has_selection = enabled
+        self._sync_action_buttons()
+        
+    def _sync_action_buttons(self):
+        """Push the selection and save state to the selection-dependent buttons, skipping no-op updates"""
+        enabled = self._has_selection and self._save_worker is None
+        if enabled == self._action_buttons_enabled:
+            return
+        self.delete_button.setEnabled(enabled)
+        self._action_buttons_enabled = enabled
             
     def populate_camera_form(self, camera_data):
         """Populate the form with camera data"""
         if not camera_data:
             return
             
-        self.camera_name_edit.setText(camera_data.get('camera_name', ''))
-        self.location_edit.setText(camera_data.get('location', ''))
-        self.ip_address_edit.setText(camera_data.get('ip_address', ''))
-        self.port_spin.setValue(camera_data.get('port', 8080))
-        self.username_edit.setText(camera_data.get('username', ''))
-        self.password_edit.setText(camera_data.get('password', ''))
-        self.video_source_edit.setText(camera_data.get('video_source', ''))
+        # Fill every field without emitting per-widget change signals
+        widgets = [getattr(self, attr) for attr, _, _, _, _ in _FIELDS]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            for key, _, setter, default in self._fields:
+                setter(camera_data.get(key, default))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
         
     def clear_camera_form(self):
         """Clear all form fields"""
-        self.camera_name_edit.clear()
-        self.location_edit.clear()
-        self.ip_address_edit.clear()
-        self.port_spin.setValue(8080)
-        self.username_edit.clear()
-        self.password_edit.clear()
-        self.video_source_edit.clear()
+        if self.camera_name_edit is None:
+            return  # Form not built yet
+            
+        for _, _, setter, default in self._fields:
+            setter(default)
         
     def add_camera(self):
         """Add a new camera"""
-        # Clear form for new camera
-        self.clear_camera_form()
-        
         # Load latest configuration to get accurate camera count
-        self.camera_manager.load_config()
+        self.camera_manager.reload_if_changed()
         
         # Generate new camera ID
-        cameras = self.camera_manager.get_all_cameras()
-        camera_count = len(cameras) + 1
-        new_id = f"CAM_{camera_count:03d}"
+        existing_ids = self.camera_manager.get_existing_ids()
+        camera_count = self.camera_manager.camera_count() + 1
+        new_id = _camera_id(camera_count)
         
         # Ensure ID is unique
-        while self.camera_manager.is_id_exists(new_id):
+        while new_id in existing_ids:
             camera_count += 1
-            new_id = f"CAM_{camera_count:03d}"
+            new_id = _camera_id(camera_count)
         
-        # Set default values
-        self.camera_name_edit.setText(f"New Camera {camera_count}")
+        # Set default values for every field in one pass
+        self._default_new_camera_name = f"New Camera {camera_count}"
+        self._ensure_config_panel()
+        self.populate_camera_form({'camera_name': self._default_new_camera_name})
         self.camera_name_edit.setFocus()
         self.camera_name_edit.selectAll()
         
         # Deselect current item
         self.camera_list.setCurrentRow(-1)
+        self._sel_timer.stop()  # keep the defaults above, _apply_selection would clear them
+        self.set_action_buttons_enabled(False)
         
         # Set add mode
         self.current_mode = "add"
         self.current_camera_id = new_id  # Store the new ID that will be used
+        self.update_apply_button()
         
     def delete_camera(self):
         """Delete the selected camera"""
@@ -269,209 +403,279 @@ class ConfigPopup(QDialog):
         camera_name = camera_data.get('camera_name', 'Unknown')
         camera_id = camera_data.get('camera_id', 'Unknown')
         
-        # Debug output
-        print(f"DEBUG: Attempting to delete camera: {camera_name} (ID: {camera_id})")
-        print(f"DEBUG: self.current_camera_id: {self.current_camera_id}")
-        print(f"DEBUG: camera_data: {camera_data}")
+        logger.debug("Attempting to delete camera: %s (ID: %s)", camera_name, camera_id)
+        logger.debug("self.current_camera_id: %s", self.current_camera_id)
+        logger.debug("camera_data: %s", camera_data)
         
-        reply = QMessageBox.question(
-            self, 
+        # Ask without a nested event loop so the dialog keeps repainting
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
             "Delete Camera", 
             f"Are you sure you want to delete camera '{camera_name}' (ID: {camera_id})?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            self
+        )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.buttonClicked.connect(
+            lambda button: self._finalize_delete(box.standardButton(button), camera_id, camera_name)
         )
+        box.open()
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Load latest configuration before deleting
-                self.camera_manager.load_config()
-                
-                # Use camera_id from camera_data instead of self.current_camera_id
-                print(f"DEBUG: Calling remove_camera with ID: {camera_id}, Name: {camera_name}")
-                result = self.camera_manager.remove_camera(camera_id=camera_id, camera_name=camera_name)
-                
-                print(f"DEBUG: remove_camera returned: {result}")
-                
-                if result:
-                    row = self.camera_list.row(current_item)
-                    self.camera_list.takeItem(row)
-                    self.clear_camera_form()
-                    
-                    # Reset mode and current camera ID
-                    self.current_mode = None
-                    self.current_camera_id = None
-                    
-                    # Mark that changes were made
-                    self.changes_made = True
-                    
-                    # Create a message box that auto-closes
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle("Success")
-                    msg_box.setText(f"Camera '{camera_name}' deleted successfully.")
-                    msg_box.setIcon(QMessageBox.Icon.Information)
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                    
-                    # Auto-close after 2 seconds
-                    timer = QTimer()
-                    timer.timeout.connect(msg_box.accept)
-                    timer.start(2000)
-                    
-                    msg_box.exec()
-                else:
-                    QMessageBox.critical(
-                        self, 
-                        "Error", 
-                        f"Failed to delete camera '{camera_name}' (ID: {camera_id}).\n\n"
-                        "The camera may not exist in the configuration file or "
-                        "there was an error saving the changes."
-                    )
-            except Exception as e:
-                print(f"DEBUG: Exception during deletion: {str(e)}")
-                QMessageBox.critical(
-                    self, 
-                    "Error", 
-                    f"An error occurred while deleting camera '{camera_name}':\n\n{str(e)}"
+    def _finalize_delete(self, reply, camera_id, camera_name):
+        """Remove the camera once the delete prompt has been answered"""
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+            
+        if self._save_worker is not None:
+            QMessageBox.warning(
+                self,
+                "Warning",
+                f"Camera '{camera_name}' was not deleted, another change is still being saved. "
+                "Please try again once it has finished."
+            )
+            return
+        
+        def delete():
+            # Load latest configuration before deleting
+            self.camera_manager.reload_if_changed()
+            
+            # Use camera_id from camera_data instead of self.current_camera_id
+            logger.debug("Calling remove_camera with ID: %s, Name: %s", camera_id, camera_name)
+            result = self.camera_manager.remove_camera(camera_id=camera_id, camera_name=camera_name)
+            
+            logger.debug("remove_camera returned: %s", result)
+            
+            if not result:
+                raise ValueError(
+                    "The camera may not exist in the configuration file or "
+                    "there was an error saving the changes."
                 )
+            return {'camera_id': camera_id, 'camera_name': camera_name}
+            
+        self._start_save("delete", camera_id, camera_name, delete)
+        
+    def _finish_delete(self, camera, error, camera_id, camera_name):
+        """Update the list once a background delete has finished"""
+        self.update_apply_button()
+        
+        if camera is None:
+            logger.debug("Exception during deletion: %s", error)
+            QMessageBox.critical(
+                self, 
+                "Error", 
+                f"Failed to delete camera '{camera_name}' (ID: {camera_id}).\n\n{error}"
+            )
+            return
+            
+        row = self._find_camera_row(camera_id)
+        if row >= 0:
+            self.camera_list.takeItem(row)
+            self.camera_list.viewport().update()
+        self._camera_items.pop(camera_id, None)
+        
+        # Clear the form and reset the mode only if the deleted camera is still the one shown
+        if self.current_camera_id == camera_id:
+            self.clear_camera_form()
+            self.current_mode = None
+            self.current_camera_id = None
+            self.update_apply_button()
+        
+        # Mark that changes were made
+        self.changes_made = True
+        
+        self.show_toast("Success", f"Camera '{camera_name}' deleted successfully.")
+     
+    def show_toast(self, title, text):
+        """Show a non-modal message box that closes itself after 2 seconds"""
+        if self._toast is None:
+            self._toast = QMessageBox(self)
+            self._toast.setIcon(QMessageBox.Icon.Information)
+            self._toast.setStandardButtons(QMessageBox.StandardButton.Ok)
+            self._toast.setModal(False)
+            
+            self._toast_timer = QTimer(self)
+            self._toast_timer.setSingleShot(True)
+            self._toast_timer.timeout.connect(self._toast.close)
+            
+        self._toast.setWindowTitle(title)
+        self._toast.setText(text)
+        self._toast.show()
+        self._toast_timer.start(2000)
      
     def apply_changes(self):
         """Apply changes without closing dialog"""
+        if self._save_worker is not None:
+            return  # Previous save still running
+            
+        # Nothing edited, skip validation and the write (and the last_updated churn)
+        if self.current_mode == "edit" and not self.has_unsaved_changes():
+            return
+            
         try:
             if self.current_mode == "add":
-                self.save_new_camera()
+                save = self.save_new_camera()
             elif self.current_mode == "edit":
-                self.update_existing_camera()
+                save = self.update_existing_camera()
             else:
-                QMessageBox.information(
-                    self, 
-                    "No Changes", 
-                    "No camera selected or no changes to apply."
-                )
-                return
-                
-            # Mark that changes were made
-            self.changes_made = True
-            
-            # Reload the camera list to reflect changes
-            self.load_cameras()
-            
-            QMessageBox.information(
+                return  # Apply is disabled without a mode
+        except Exception as e:
+            QMessageBox.critical(
                 self, 
-                "Success", 
-                "Changes applied successfully!"
+                "Error", 
+                f"Failed to apply changes: {str(e)}"
             )
+            return
             
-        except Exception as e:
+        self._start_save(self.current_mode, self.current_camera_id, None, save)
+        
+    def _start_save(self, mode, camera_id, camera_name, fn):
+        """Run a configuration write on the thread pool so the dialog never blocks on disk I/O"""
+        self._pending_save = (mode, camera_id, camera_name, self._session)
+        self._save_worker = FunctionWorker(fn)
+        self._save_worker.signals.finished.connect(self.on_save_finished)
+        self.update_apply_button()
+        QThreadPool.globalInstance().start(self._save_worker)
+        
+    def on_save_finished(self, camera, error):
+        """Handle the result of a background configuration save"""
+        mode, camera_id, camera_name, session = self._pending_save
+        self._save_worker = None
+        self._pending_save = None
+        
+        # The dialog was closed (and maybe reopened) before the save finished, so done() could
+        # not report it. Report it now, rebuild the list if it is showing again and skip the
+        # success message, nothing the user is looking at asked for it
+        if camera is not None and (session != self._session or not self.isVisible()):
+            self.update_apply_button()
+            self.configuration_changed.emit()
+            if self.isVisible():
+                self.load_cameras()
+            return
+        
+        if mode == "delete":
+            self._finish_delete(camera, error, camera_id, camera_name)
+            return
+            
+        if camera is None:
+            self.update_apply_button()
             QMessageBox.critical(
                 self, 
                 "Error", 
-                f"Failed to apply changes: {str(e)}"
+                f"Failed to apply changes: {error}"
             )
+            return
+            
+        # Mark that changes were made, reported once when the dialog finishes
+        self.changes_made = True
+        
+        # Leave add mode unless another camera was picked while saving. An edited
+        # camera stays selected, so edit mode carries on
+        if mode == "add" and self.current_mode == mode and self.current_camera_id == camera_id:
+            self.current_mode = None
+            self.current_camera_id = None
+            self._default_new_camera_name = None
+        self.update_apply_button()
+            
+        # Update only the affected row instead of rebuilding the list
+        if mode == "add":
+            self.camera_list.setCurrentItem(self._append_camera_item(camera))
+        else:
+            row = self._find_camera_row(camera_id)
+            if row >= 0:
+                self._update_camera_item(row, camera)
+            else:
+                self._append_camera_item(camera)
+        
+        QMessageBox.information(
+            self, 
+            "Success", 
+            "Changes applied successfully!"
+        )
     
     def save_new_camera(self):
-        """Save a new camera to the configuration"""
+        """Prepare a new camera and return the function that saves it"""
         form_data = self.get_camera_form_data()
         
         # Validate required fields
         self.validate_camera_form(form_data, is_new_camera=True)
         
-        # IMPORTANT: Load latest configuration first
-        self.camera_manager.load_config()
-        
-        # Generate unique camera ID
-        cameras = self.camera_manager.get_all_cameras()
-        camera_count = len(cameras) + 1
-        new_id = f'CAM_{camera_count:03d}'
-        
-        # Ensure ID is unique
-        while self.camera_manager.is_id_exists(new_id):
-            camera_count += 1
-            new_id = f'CAM_{camera_count:03d}'
-
-        if not new_id:
-            raise ValueError("Failed to generate a unique camera ID")
-
         # Add required fields for new camera
-        form_data['camera_id'] = new_id
+        now_iso = datetime.now().isoformat()
         form_data['camera_status'] = CameraStatus.NOT_WORKING.value
         form_data['parking_status'] = ParkingStatus.UNKNOWN.value
         form_data['image_path'] = ""
         form_data['detection_zones'] = []
         form_data['last_maintenance'] = None
-        form_data['installation_date'] = datetime.now().isoformat()
-        form_data['last_updated'] = datetime.now().isoformat()
-        
-        # Save to configuration
-        success = self.camera_manager.add_camera(form_data)
-        if not success:
-            raise ValueError("Failed to add camera to configuration")
+        form_data['installation_date'] = now_iso
+        form_data['last_updated'] = now_iso
         
-        print(f"DEBUG: Camera saved successfully: {success}")
-        
-        # Mark that changes were made and emit signal immediately
-        self.changes_made = True
-        self.configuration_changed.emit()
-        
-        # Reset mode
-        self.current_mode = None
-        self.current_camera_id = None
+        def save():
+            # IMPORTANT: Load latest configuration first
+            self.camera_manager.reload_if_changed()
+            
+            # Generate unique camera ID
+            existing_ids = self.camera_manager.get_existing_ids()
+            camera_count = self.camera_manager.camera_count() + 1
+            new_id = _camera_id(camera_count)
+            
+            # Ensure ID is unique
+            while new_id in existing_ids:
+                camera_count += 1
+                new_id = _camera_id(camera_count)
+
+            if not new_id:
+                raise ValueError("Failed to generate a unique camera ID")
+                
+            form_data['camera_id'] = new_id
+            
+            # Save to configuration
+            success = self.camera_manager.add_camera(form_data)
+            if not success:
+                raise ValueError("Failed to add camera to configuration")
+            
+            logger.debug("Camera saved successfully: %s", success)
+            return form_data
+            
+        return save
         
     def update_existing_camera(self):
-        """Update an existing camera in the configuration"""
+        """Prepare an edited camera and return the function that saves it"""
         form_data = self.get_camera_form_data()
-        
-        # IMPORTANT: Load latest configuration first
-        self.camera_manager.load_config()
-        
-        old_config = self.camera_manager.get_camera_by_id(self.current_camera_id)
-
-        if not old_config:
-            raise ValueError(f"Camera with ID {self.current_camera_id} not found")
+        camera_id = self.current_camera_id
         
         self.validate_camera_form(form_data, is_new_camera=False)
+        
+        def save():
+            # IMPORTANT: Load latest configuration first
+            self.camera_manager.reload_if_changed()
+            
+            old_config = self.camera_manager.get_camera_by_id(camera_id)
 
-        print(f"DEBUG: Updating camera {self.current_camera_id} with data: {form_data}")
-
-        # Preserve existing metadata and update form data
-        form_data['camera_id'] = self.current_camera_id
-        form_data['camera_status'] = old_config.get('camera_status', CameraStatus.NOT_WORKING.value)
-        form_data['parking_status'] = old_config.get('parking_status', ParkingStatus.UNKNOWN.value)
-        form_data['image_path'] = old_config.get('image_path', "")
-        form_data['detection_zones'] = old_config.get('detection_zones', [])
-        form_data['last_maintenance'] = old_config.get('last_maintenance')
-        form_data['installation_date'] = old_config.get('installation_date')
-        form_data['last_updated'] = datetime.now().isoformat()
-
-        # Update the camera in the configuration directly
-        cameras = self.camera_manager.get_all_cameras()
-        for i, camera in enumerate(cameras):
-            if camera.get('camera_id') == self.current_camera_id:
-                # Replace the entire camera object
-                self.camera_manager._config_data['cameras'][i] = form_data
-                break
-        
-        # Save the configuration
-        success = self.camera_manager.save_config()
-        if not success:
-            raise ValueError("Failed to save camera configuration")
-        
-        print(f"DEBUG: Camera updated successfully")
+            if not old_config:
+                raise ValueError(f"Camera with ID {camera_id} not found")
 
-        # Mark that changes were made and emit signal immediately
-        self.changes_made = True
-        self.configuration_changed.emit()
+            logger.debug("Updating camera %s with data: %s", camera_id, form_data)
 
-        # Update the list item if camera name changed
-        old_camera_name = old_config.get('camera_name', '')
-        if form_data['camera_name'] != old_camera_name:
-            current_item = self.camera_list.currentItem()
-            if current_item:
-                current_item.setText(f"{form_data['camera_name']} ({self.current_camera_id})")
-                current_item.setData(Qt.ItemDataRole.UserRole, form_data)
+            # Preserve existing metadata and update form data
+            form_data['camera_id'] = camera_id
+            form_data['camera_status'] = old_config.get('camera_status', CameraStatus.NOT_WORKING.value)
+            form_data['parking_status'] = old_config.get('parking_status', ParkingStatus.UNKNOWN.value)
+            form_data['image_path'] = old_config.get('image_path', "")
+            form_data['detection_zones'] = old_config.get('detection_zones', [])
+            form_data['last_maintenance'] = old_config.get('last_maintenance')
+            form_data['installation_date'] = old_config.get('installation_date')
+            form_data['last_updated'] = datetime.now().isoformat()
 
-        # Reset mode
-        self.current_mode = None
-        self.current_camera_id = None
+            # Replace the entire camera object and save the configuration
+            success = self.camera_manager.update_camera(camera_id, form_data)
+            if not success:
+                raise ValueError("Failed to save camera configuration")
+            
+            logger.debug("Camera updated successfully")
+            return form_data
+            
+        return save
 
     def validate_camera_form(self, form_data, is_new_camera=True):
         """Validate camera form data"""
@@ -486,9 +690,8 @@ class ConfigPopup(QDialog):
         
         # Validate IP address format if provided
         if form_data['ip_address'].strip():
-            import re
-            ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-            if not re.match(ip_pattern, form_data['ip_address']):
+            match = _IP_RE.match(form_data['ip_address'])
+            if not match or any(int(octet) > 255 for octet in match.groups()):
                 errors.append("Invalid IP address format")
         
         # Validate port range
@@ -500,33 +703,22 @@ class ConfigPopup(QDialog):
         
     def has_unsaved_changes(self):
         """Check if there are unsaved changes in the form"""
+        # Widgets are read lazily so the check stops at the first difference
         if self.current_mode == "add":
             # Check if form has any non-default values
-            form_data = self.get_camera_form_data()
-            return any([
-                form_data['camera_name'] != f"New Camera {len(self.camera_manager.get_all_cameras()) + 1}",
-                form_data['location'].strip(),
-                form_data['ip_address'].strip(),
-                form_data['port'] != 8080,
-                form_data['username'].strip(),
-                form_data['password'].strip(),
-                form_data['video_source'].strip()
-            ])
+            return any(
+                getter() != (self._default_new_camera_name if key == 'camera_name' else default)
+                for key, getter, _, default in self._fields
+            )
         elif self.current_mode == "edit" and self.current_camera_id:
             # Compare current form data with original camera data
             current_item = self.camera_list.currentItem()
             if current_item:
                 original_data = current_item.data(Qt.ItemDataRole.UserRole)
-                form_data = self.get_camera_form_data()
-                return any([
-                    form_data['camera_name'] != original_data.get('camera_name', ''),
-                    form_data['location'] != original_data.get('location', ''),
-                    form_data['ip_address'] != original_data.get('ip_address', ''),
-                    form_data['port'] != original_data.get('port', 8080),
-                    form_data['username'] != original_data.get('username', ''),
-                    form_data['password'] != original_data.get('password', ''),
-                    form_data['video_source'] != original_data.get('video_source', '')
-                ])
+                return any(
+                    getter() != original_data.get(key, default)
+                    for key, getter, _, default in self._fields
+                )
         return False
     
     def is_add_mode(self):
@@ -548,21 +740,31 @@ class ConfigPopup(QDialog):
     
     def get_camera_form_data(self):
         """Get current form data as a dictionary"""
-        return {
-            'camera_name': self.camera_name_edit.text().strip(),
-            'location': self.location_edit.text().strip(),
-            'ip_address': self.ip_address_edit.text().strip(),
-            'port': self.port_spin.value(),
-            'username': self.username_edit.text().strip(),
-            'password': self.password_edit.text().strip(),
-            'video_source': self.video_source_edit.text().strip()
-        }
+        return {key: getter() for key, getter, _, _ in self._fields}
+    
+    def reset_session(self):
+        """Return a reused dialog to its just-opened state with the current configuration"""
+        self._session += 1
+        self._sel_timer.stop()
+        self.current_mode = None
+        self.current_camera_id = None
+        self._default_new_camera_name = None
+        
+        self.camera_list.blockSignals(True)
+        self.camera_list.setCurrentRow(-1)
+        self.camera_list.blockSignals(False)
+        self.clear_camera_form()
+        self.set_action_buttons_enabled(False)
+        self.update_apply_button()
+        
+        # Statuses and cameras may have changed while the dialog was hidden
+        self.load_cameras()
     
-    def closeEvent(self, event):
-        """Handle dialog close event"""
-        # Emit signal if any changes were made during this session
+    def done(self, result):
+        """Finish the dialog (OK, Cancel or window close)"""
+        # Emit signal once if any changes were made during this session
         if self.changes_made:
+            self.changes_made = False
             self.configuration_changed.emit()
         
-        # Accept the close event
-        super().closeEvent(event)
\ No newline at end of file
+        super().done(result)
\ No newline at end of file
@@ -1,13 +1,31 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QMessageBox, QHBoxLayout, QPushButton, QDialog, QDialog
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QElapsedTimer, QThreadPool
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QMessageBox, QPushButton, QSizePolicy
 from src.gui.CamSelector import CameraSelector
 from src.gui.CamCard import CamCardFrame
 from src.gui.ConfigPopup import ConfigPopup
+from src.gui.workers import FunctionWorker
 from src.config.utils import CameraConfigManager
 from src.CameraManager import CameraManager
 from src.enums import CameraStatus, ParkingStatus
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# Working directory at startup, relative image paths in the config resolve against it
+_ROOT_PREFIX = os.path.abspath(os.curdir) + os.sep
+
+# Delay that collects a burst of data updates, and the shortest gap between two refreshes
+REFRESH_DELAY_MS = 50
+MIN_REFRESH_INTERVAL_MS = 100
+
+# Dashboard background, scoped by object name so it can be installed once on the application
+DASHBOARD_QSS = """
+    QWidget#Dashboard, QWidget#Dashboard QWidget {
+        background-color: #1a1a1a;
+    }
+"""
+
 class Dashboard(QWidget):
     switch_to_config_page = pyqtSignal(dict)
 
@@ -17,10 +35,21 @@ class Dashboard(QWidget):
         # Initialize camera config manager
         self.config_manager = CameraConfigManager()
         
+        # UI snapshot of the configuration, rebuilt only when the config file changes
+        self._cam_cache = {'mtime': None, 'ui': None, 'ids': None, 'names': None, 'statuses': None}
+        self._by_id = {}
+        self._by_name = {}
+        
+        # Parallel arrays of what the selector currently shows, plus a name -> index map
+        self._cam_ids = None
+        self._cam_names = None
+        self._cam_statuses = None
+        self._cam_name_to_idx = {}
+        
         # Load camera data from JSON configuration
         if cameras_name is None or camera_statuses is None:
-            self.camera_names = self.config_manager.get_camera_names()
-            self.camera_statuses = self.config_manager.get_camera_statuses()
+            self.camera_names = self._get_camera_names()
+            self.camera_statuses = self._get_camera_statuses()
         else:
             self.camera_names = cameras_name
             self.camera_statuses = camera_statuses
@@ -28,33 +57,142 @@ class Dashboard(QWidget):
         self.selected_camera = self.camera_names[0] if self.camera_names else None
 
         # Initialize camera manager - it will get camera IDs from config automatically
-        self.camera_manager = CameraManager(use_gpu=use_gpu)
+        self.camera_manager = CameraManager(use_gpu=use_gpu, parent=self)
+        self._shut_down = False
+        self._config_popup = None  # Camera configuration dialog, built on first open
+        
+        # Coalesce bursts of data updates into a single UI refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._last_refresh = QElapsedTimer()  # Invalid until the first refresh
+        self._snapshot_worker = None
+        self._refresh_pending = False
+        
+        # Status changes waiting to be saved, {(camera_id, camera_name): {field: value}},
+        # written together on the thread pool once the burst settles
+        self._pending_status_writes = {}
+        self._status_write_timer = QTimer(self)
+        self._status_write_timer.setSingleShot(True)
+        self._status_write_timer.setInterval(REFRESH_DELAY_MS)
+        self._status_write_timer.timeout.connect(self._flush_status_writes)
+        self._status_writer = None
         
-        # Connect camera manager signals - new simplified signals
-        self.camera_manager.data_updated.connect(self.on_data_updated)
-        self.camera_manager.error_occurred.connect(self.on_camera_error)
-        self.camera_manager.camera_processed.connect(self.on_camera_processed)
+        # Connect camera manager signals - emitted from worker threads, so queue them explicitly
+        self.camera_manager.data_updated.connect(self.on_data_updated, Qt.ConnectionType.QueuedConnection)
+        self.camera_manager.error_occurred.connect(self.on_camera_error, Qt.ConnectionType.QueuedConnection)
+        self.camera_manager.camera_processed.connect(self.on_camera_processed, Qt.ConnectionType.QueuedConnection)
+        
+        # Stop background work deterministically, not from a finalizer
+        QApplication.instance().aboutToQuit.connect(self.cleanup)
         
         # Start monitoring
         self.camera_manager.start_monitoring()
 
         self.init_ui()
 
+    def _config_stamp(self):
+        """Get the (mtime, size, inode) stamp of the config file, or None"""
+        try:
+            stat = os.stat(self.config_manager.config_file_path)
+            return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return None
+    
+    def _read_cam_snapshot(self, mtime):
+        """Read a camera snapshot from the configuration, safe to call off the GUI thread"""
+        # Both views come from one read, a concurrent write cannot put them out of step
+        cameras, ui_cameras = self.config_manager.get_cameras_with_ui()
+        
+        # Ensure image paths are absolute (rooted, UNC or drive-letter paths are left alone).
+        # The manager's UI list is shared, so rewritten cameras are copied
+        cameras_data = []
+        for camera in ui_cameras:
+            image = camera.get('image')
+            if image and image[0] not in '/\\' and (len(image) < 2 or image[1] != ':'):
+                camera = dict(camera, image=_ROOT_PREFIX + image)
+            cameras_data.append(camera)
+        
+        # Parallel id/name/status arrays in a single pass over the configuration
+        ids, names, statuses = [], [], []
+        for camera in cameras:
+            ids.append(camera.get('camera_id'))
+            names.append(camera.get('camera_name', 'Unknown'))
+            statuses.append(camera.get('camera_status', 'unknown'))
+        
+        return {
+            'mtime': mtime,
+            'ui': cameras_data,
+            'ids': ids,
+            'names': names,
+            'statuses': statuses
+        }
+    
+    def _apply_cam_snapshot(self, snapshot):
+        """Install a camera snapshot as the cache and rebuild the lookup indexes"""
+        self._cam_cache.update(snapshot)
+        
+        # Lookup indexes over the same snapshot (first camera wins on duplicate names)
+        cameras_data = snapshot['ui']
+        self._by_id = {camera['camera_id']: camera for camera in cameras_data}
+        self._by_name = {}
+        for camera in cameras_data:
+            self._by_name.setdefault(camera['camera_name'], camera)
+    
+    def _refresh_cam_cache(self):
+        """Rebuild the cached camera snapshot if the config file changed"""
+        mtime = self._config_stamp()
+        cache = self._cam_cache
+        if mtime is not None and mtime == cache['mtime']:
+            return cache
+        
+        self._apply_cam_snapshot(self._read_cam_snapshot(mtime))
+        return cache
+    
+    def _invalidate_cam_cache(self):
+        """Force the next snapshot read to rebuild from the configuration"""
+        self._cam_cache['mtime'] = None
+    
+    def _get_ui_cameras(self):
+        """Get UI camera dicts with absolute image paths"""
+        return self._refresh_cam_cache()['ui']
+    
+    def _get_camera_names(self):
+        """Get the cached list of camera names"""
+        return self._refresh_cam_cache()['names']
+    
+    def _get_camera_statuses(self):
+        """Get the cached list of camera statuses"""
+        return self._refresh_cam_cache()['statuses']
+    
+    def _camera_by_id(self, camera_id):
+        """Look up a camera in the cached snapshot by ID"""
+        self._refresh_cam_cache()
+        return self._by_id.get(camera_id)
+    
+    def _camera_by_name(self, camera_name):
+        """Look up a camera in the cached snapshot by name"""
+        self._refresh_cam_cache()
+        return self._by_name.get(camera_name)
+
     def init_ui(self):
         self.setWindowTitle("Dashboard")
         self.setGeometry(0, 0, 1400, 800)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-            }
-        """)
+        self.setObjectName("Dashboard")
+        # Parsed once when the application carries the stylesheet, otherwise apply it locally
+        if DASHBOARD_QSS not in QApplication.instance().styleSheet():
+            self.setStyleSheet(DASHBOARD_QSS)
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(20, 20, 20, 20)
         self.main_layout.setSpacing(5)  # Add spacing between components
 
-        # Create both camera selector and camera cards
-        self.setup_dashboard_ui()
+        # Create both camera selector and camera cards, painting once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_dashboard_ui()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setup_dashboard_ui(self):
         """Setup the complete dashboard UI with both camera selector and cards"""
@@ -106,48 +244,68 @@ class Dashboard(QWidget):
         """Add the camera selector widget"""
         # Create camera selector
         self.camera_selector = CameraSelector()
-        self.camera_selector.camera_selected.connect(lambda: self.change_to_config_page(self.camera_selector.get_selected_camera()))
+        self.camera_selector.camera_selected.connect(self.change_to_config_page)  # emits the selected camera
         self.camera_selector.camera_changed.connect(self.on_camera_selection_changed)
         
+        # Start status diffing from the rows the selector was built with
+        rows = self.camera_selector.camera_model.rows
+        self._set_selector_cameras([row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows])
+        
         # Add to layout
         self.main_layout.addWidget(self.camera_selector)
 
-    def add_camera_cards(self):
-        """Add camera cards in a grid layout"""
-        # Get camera data from JSON configuration
-        self.config_manager.load_config()
-        cameras_data = self.config_manager.get_cameras_for_ui()
-          # Ensure image paths are absolute
-        ROOT_DIR = os.path.abspath(os.curdir)
-        for camera in cameras_data:
-            if camera.get('image') and not os.path.isabs(camera['image']):
-                camera['image'] = os.path.join(ROOT_DIR, camera['image'])
+    def _set_selector_cameras(self, ids, names, statuses):
+        """Record the cameras the selector shows as parallel arrays plus a name index"""
+        self._cam_ids = list(ids)
+        self._cam_names = list(names)
+        self._cam_statuses = list(statuses)
+        self._cam_name_to_idx = {}
+        for i, name in enumerate(names):
+            self._cam_name_to_idx.setdefault(name, i)
 
-        cameras_card = CamCardFrame()
-        cameras_card.card_clicked.connect(lambda cam_id: self.handle_camera_card_click(cam_id))
+    def add_camera_cards(self):
+        """Reserve the camera cards area; the cards are built on first show"""
+        self.cameras_card = None
+        self._cards_placeholder = QWidget()
+        self._cards_placeholder.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         # Add with stretch factor to make the camera cards area take more space
-        self.main_layout.addWidget(cameras_card, 2)
+        self.main_layout.addWidget(self._cards_placeholder, 2)
+
+    def _build_camera_cards(self):
+        """Create the camera cards frame and swap it in for the placeholder"""
+        self.cameras_card = CamCardFrame(cameras=self._get_ui_cameras())
+        self.cameras_card.card_clicked.connect(self.handle_camera_card_click)
+        self.main_layout.replaceWidget(self._cards_placeholder, self.cameras_card)
+        self._cards_placeholder.deleteLater()
+        self._cards_placeholder = None
+        # Keep the overlay config button above the newly created frame
+        self.config_button.raise_()
+
+    def showEvent(self, event):
+        """Build the camera cards the first time the dashboard is shown"""
+        super().showEvent(event)
+        if self.cameras_card is None:
+            self._build_camera_cards()
 
     def handle_camera_card_click(self, camera_id):
         """Handle camera card click by finding the camera name and updating selector"""
-        self.config_manager.load_config()
-        camera = self.config_manager.get_camera_by_id(camera_id)
+        camera = self._camera_by_id(camera_id)
         if camera:
             camera_name = camera.get('camera_name')
             if camera_name:
                 self.camera_selector.set_selected_camera(camera_name)
         else:
-            print(f"Camera with ID {camera_id} not found")
+            logger.warning("Camera with ID %s not found", camera_id)
 
     def refresh_card_selection(self):
         """Refresh the visual selection of camera cards"""
         # This would ideally update the card styling
         # For now, we'll just store the selection
-        print(f"Selected camera updated to: {self.selected_camera}")
+        logger.debug("Selected camera updated to: %s", self.selected_camera)
     
     def on_camera_selection_changed(self, camera_name):
         """Handle when user selects a different camera (legacy method)"""
-        print(f"DASHBOARD: Selected camera: {camera_name}")
+        logger.debug("Selected camera: %s", camera_name)
         self.selected_camera = camera_name
 
     def get_selected_camera(self):
@@ -158,83 +316,166 @@ class Dashboard(QWidget):
     
     def change_to_config_page(self, selected_camera=None):
         """Switch to the configuration page"""
-        print(f"Changing to config page... {selected_camera}")
+        logger.debug("Changing to config page... %s", selected_camera)
         if selected_camera:
             self.switch_to_config_page.emit(selected_camera)
         else:
             QMessageBox.warning(self, "No Camera Selected", "Please select a camera before configuring.")
-            print("No camera selected.")
+            logger.warning("No camera selected.")
 
     def update_camera_status_in_config(self, camera_name: str, status: str):
         """Update camera status in configuration file using both camera_id and camera_name"""
-        self.config_manager.load_config()
-        camera = self.config_manager.get_camera_by_name(camera_name)
-        if camera:
-            camera_id = camera.get('camera_id')
-            if camera_id:
-                # Validate camera exists with both fields
-                if self.config_manager.validate_camera_exists(camera_id, camera_name):
-                    success = self.config_manager.update_camera_status(camera_id, camera_name, status)
-
-                    if success:
-                        self.refresh_camera_data()
-                    else:
-                        print(f"Failed to update camera status for {camera_name}")
-                else:
-                    print(f"Camera validation failed for {camera_name}")
-            else:
-                print(f"Camera ID not found for {camera_name}")
-        else:
-            print(f"Camera {camera_name} not found")
+        self._queue_status_write(camera_name, 'camera_status', status)
     
     def update_parking_status_in_config(self, camera_name: str, parking_status: str):
         """Update parking status in configuration file using both camera_id and camera_name"""
-        self.config_manager.load_config()
-        camera = self.config_manager.get_camera_by_name(camera_name)
+        self._queue_status_write(camera_name, 'parking_status', parking_status)
+    
+    def _queue_status_write(self, camera_name: str, field: str, value: str):
+        """Queue a status change for the next batched configuration write"""
+        camera = self._camera_by_name(camera_name)
         if camera:
             camera_id = camera.get('camera_id')
             if camera_id:
-                # Validate camera exists with both fields
-                if self.config_manager.validate_camera_exists(camera_id, camera_name):
-                    success = self.config_manager.update_parking_status(camera_id, camera_name, parking_status)
-                    if success:
-                        # Refresh the camera cards to show updated status
-                        self.refresh_camera_cards()
-                    else:
-                        print(f"Failed to update parking status for {camera_name}")
-                else:
-                    print(f"Camera validation failed for {camera_name}")
+                key = (camera_id, camera_name)
+                pending = self._pending_status_writes.get(key, {})
+                # Already in this state (or about to be), skip the write and refresh
+                if pending.get(field, camera.get(field)) == value:
+                    return
+                self._pending_status_writes.setdefault(key, pending)[field] = value
+                if not self._status_write_timer.isActive():
+                    self._status_write_timer.start()
             else:
-                print(f"Camera ID not found for {camera_name}")
+                logger.warning("Camera ID not found for %s", camera_name)
         else:
-            print(f"Camera {camera_name} not found")
+            logger.warning("Camera %s not found", camera_name)
+    
+    def _flush_status_writes(self):
+        """Save every queued status change in one write on the thread pool"""
+        # A write is already running, the rest goes out once it lands
+        if self._status_writer is not None or not self._pending_status_writes:
+            return
+        
+        # The update itself checks that each camera_id and camera_name still match
+        updates, self._pending_status_writes = self._pending_status_writes, {}
+        self._status_writer = FunctionWorker(lambda: self.config_manager.update_camera_statuses(updates))
+        self._status_writer.signals.finished.connect(
+            lambda success, error: self._on_status_write_finished(updates, success, error))
+        QThreadPool.globalInstance().start(self._status_writer)
+    
+    def _on_status_write_finished(self, updates, success, error):
+        """Refresh the views once a batched status write has been saved"""
+        self._status_writer = None
+        if not success:
+            logger.warning("Failed to update status for %s (%s)",
+                           ", ".join(name for _, name in updates), error or "camera not found")
+        if self._shut_down:
+            return
+        self._invalidate_cam_cache()
+        self._schedule_refresh()
+        
+        if self._pending_status_writes:
+            self._status_write_timer.start()
     
     def refresh_camera_data(self):
         """Refresh camera data from JSON configuration"""
-        print("Dashboard: Refreshing camera data...")
+        logger.debug("Refreshing camera data...")
         
-        # Reload configuration from file to get latest changes
-        self.config_manager.load_config()
+        # Get fresh data, re-read only if the configuration file changed
+        self.camera_names = self._get_camera_names()
+        self.camera_statuses = self._get_camera_statuses()
         
-        # Get fresh data
-        self.camera_names = self.config_manager.get_camera_names()
-        self.camera_statuses = self.config_manager.get_camera_statuses()
+        names = self.camera_names
+        ids = self._cam_cache['ids']
+        statuses = self.camera_statuses
+        
+        # Same cameras as last time (and unique names): only repaint the buttons whose status changed
+        if (names == self._cam_names and ids == self._cam_ids
+                and len(self._cam_name_to_idx) == len(names)):
+            shown = self._cam_statuses
+            for i, status in enumerate(statuses):
+                if shown[i] != status:
+                    shown[i] = status
+                    self.camera_selector.update_camera_status(names[i], status)
+            return
+        
+        self._set_selector_cameras(ids, names, statuses)
     
-        self.camera_selector.update_camera_statuses()
+        # Cameras were added, removed or renamed: rebuild the selector buttons in one repaint
+        self.camera_selector.setUpdatesEnabled(False)
+        try:
+            self.camera_selector.update_camera_statuses()
+        finally:
+            self.camera_selector.setUpdatesEnabled(True)
     
     def refresh_camera_cards(self):
         """Refresh camera cards with updated data from configuration"""
-        # Find and update the CamCardFrame widget
-        for i in range(self.main_layout.count()):
-            widget = self.main_layout.itemAt(i).widget()
-            if hasattr(widget, '__class__') and widget.__class__.__name__ == 'CamCardFrame':
-                # Update the existing widget instead of recreating it
-                widget.update_camera_cards()
-                break
+        # Not built yet, it reads the current configuration when first shown
+        if self.cameras_card is None:
+            return
+        
+        # Update the existing widget in one repaint instead of recreating it
+        self.cameras_card.setUpdatesEnabled(False)
+        try:
+            self.cameras_card.update_camera_cards(self._get_ui_cameras())
+        finally:
+            self.cameras_card.setUpdatesEnabled(True)
 
     def on_data_updated(self, camera_id: str):
         """Handle when camera data is updated in JSON - refresh UI from config"""
-        print(f"Data updated for camera {camera_id}, refreshing UI from JSON")
+        logger.debug("Data updated for camera %s, refreshing UI from JSON", camera_id)
+        
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Refresh camera data and cards once, at most every MIN_REFRESH_INTERVAL_MS"""
+        # Signals queued before cleanup() can still arrive, there is nothing left to refresh
+        if self._shut_down:
+            return
+        # Already scheduled: this change is picked up by that refresh. Not restarting
+        # the timer keeps a steady stream of updates from postponing it indefinitely
+        if self._refresh_timer.isActive():
+            return
+        delay = REFRESH_DELAY_MS
+        if self._last_refresh.isValid():
+            delay = max(delay, MIN_REFRESH_INTERVAL_MS - self._last_refresh.elapsed())
+        self._refresh_timer.start(delay)
+    
+    def _do_refresh(self):
+        """Refresh camera data and cards once per burst of data updates"""
+        # A read is already running, refresh again once it lands
+        if self._snapshot_worker is not None:
+            self._refresh_pending = True
+            return
+        
+        mtime = self._config_stamp()
+        if mtime is not None and mtime == self._cam_cache['mtime']:
+            self._refresh_views()
+            return
+        
+        # Read the changed configuration in the thread pool, apply it on the GUI thread
+        self._snapshot_worker = FunctionWorker(lambda: self._read_cam_snapshot(mtime))
+        self._snapshot_worker.signals.finished.connect(self._on_snapshot_ready)
+        QThreadPool.globalInstance().start(self._snapshot_worker)
+    
+    def _on_snapshot_ready(self, snapshot, error):
+        """Apply a snapshot read in the background and refresh the views"""
+        self._snapshot_worker = None
+        if error is not None:
+            logger.error("Failed to read camera configuration: %s", error, exc_info=error)
+        if self._shut_down:
+            return
+        if snapshot is not None:
+            self._apply_cam_snapshot(snapshot)
+        self._refresh_views()
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._schedule_refresh()
+    
+    def _refresh_views(self):
+        """Refresh camera data and cards from the cached snapshot"""
+        self._last_refresh.start()
         
         # Refresh camera data from JSON
         self.refresh_camera_data()
@@ -244,11 +485,12 @@ class Dashboard(QWidget):
     
     def on_camera_error(self, camera_id: str, error_message: str):
         """Handle camera errors"""
-        print(f"Camera error for {camera_id}: {error_message}")
+        logger.warning("Camera error for %s: %s", camera_id, error_message)
+        if self._shut_down:
+            return
         
         # Update camera status to error in config
-        self.config_manager.load_config()
-        camera = self.config_manager.get_camera_by_id(camera_id)
+        camera = self._camera_by_id(camera_id)
         if camera:
             camera_name = camera.get('camera_name', '')
             if camera_name:
@@ -257,33 +499,53 @@ class Dashboard(QWidget):
     
     def on_camera_processed(self, camera_id: str):
         """Handle when camera processing is complete"""
-        print(f"Camera {camera_id} processing complete")
+        logger.debug("Camera %s processing complete", camera_id)
         # Could add specific UI updates here if needed
     
     def cleanup(self):
         """Clean up resources when dashboard is closed"""
-        if hasattr(self, 'camera_manager'):
-            self.camera_manager.shutdown()
+        if self._shut_down:
+            return
+        self._shut_down = True
+        self._refresh_timer.stop()
+        
+        # Save status changes that are still queued, there is no later batch to join
+        self._status_write_timer.stop()
+        if self._pending_status_writes:
+            updates, self._pending_status_writes = self._pending_status_writes, {}
+            if not self.config_manager.update_camera_statuses(updates):
+                logger.warning("Failed to update status for %s", ", ".join(name for _, name in updates))
+        
+        # Stop taking new work from the camera manager before it shuts down
+        for signal, slot in ((self.camera_manager.data_updated, self.on_data_updated),
+                             (self.camera_manager.error_occurred, self.on_camera_error),
+                             (self.camera_manager.camera_processed, self.on_camera_processed)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        self.camera_manager.shutdown()
     
-    def __del__(self):
-        """Destructor to ensure cleanup"""
+    def closeEvent(self, event):
+        """Shut down the camera manager before the dashboard goes away"""
         self.cleanup()
+        super().closeEvent(event)
 
     def show_config_popup(self):
         """Show the camera configuration popup"""
-        config_popup = ConfigPopup()
-        
-        # Connect to the configuration_changed signal
-        config_popup.configuration_changed.connect(self.refresh_ui_after_config_changes)
-        
-        result = config_popup.exec()
+        # Built on first use and kept, later opens only reload its camera list
+        if self._config_popup is None:
+            self._config_popup = ConfigPopup()
+            
+            # Refresh the dashboard once, when the popup closes after saving changes
+            self._config_popup.configuration_changed.connect(self.refresh_ui_after_config_changes)
+        else:
+            self._config_popup.reset_session()
         
-        # If user clicked OK or Apply, refresh the dashboard
-        if result == QDialog.DialogCode.Accepted:
-            self.refresh_camera_data()
-            self.refresh_camera_cards()
+        self._config_popup.exec()
     
     def refresh_ui_after_config_changes(self):
         """Refresh UI after configuration changes"""
-        self.refresh_camera_data()
-        self.refresh_camera_cards()
+        # Scheduled like any other change, so it merges with pending data updates
+        # and the views repaint once through Qt's normal update cycle
+        self._schedule_refresh()
@@ -1,8 +1,21 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QMessageBox, QStackedWidget, QWidget)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
+import logging
+import re
 import requests
+from requests.adapters import HTTPAdapter
 from src.client import get_info
+from src.gui.workers import FunctionWorker
+
+logger = logging.getLogger(__name__)
+
+# Gmail address with a non-empty username, compiled once and shared by every dialog
+_GMAIL_RE = re.compile(r'^[^@\s]+@gmail\.com\Z')
+
+# Shared session so consecutive requests to the auth server reuse the keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
 
 class GmailDialog(QDialog):    
@@ -13,6 +26,13 @@ class GmailDialog(QDialog):
         self._create_interface()
         self.email = None
         
+        # Running request worker and the buttons disabled while it is in flight
+        self._request_worker = None
+        self._busy_buttons = ()
+        
+        # System info sent with login and verify requests, collected on first use
+        self._base_payload = None
+        
     def _setup_window(self):
         """Configure the main dialog window properties."""
         self.setWindowTitle("Gmail Authentication")
@@ -96,6 +116,7 @@ class GmailDialog(QDialog):
         self.reg_email_label = QLabel("Gmail address:")
         self.reg_email_input = QLineEdit()
         self.reg_email_input.setPlaceholderText("example@gmail.com")
+        self.reg_email_input.returnPressed.connect(self.send_verification_code)
         
         # Verification code sending
         self.send_code_button = QPushButton("Send Verification Code")
@@ -139,6 +160,9 @@ class GmailDialog(QDialog):
         
         Checks Gmail format, sends heartbeat to server, and handles authentication.
         """
+        if self._request_worker is not None:
+            return
+            
         email_address = self.email_input.text().strip()
         
         # Validate email format
@@ -150,13 +174,22 @@ class GmailDialog(QDialog):
         # Prepare authentication request
         self.email = email_address
         url = "https://authen-traffic-api.onrender.com/heartbeat"
-        payload = get_info()
-        payload['email'] = self.email
         
-        try:
-            # Send authentication request
-            response = requests.post(url, json=payload, timeout=10)
+        def heartbeat():
+            payload = self._get_base_payload()
+            payload['email'] = email_address
+            return _SESSION.post(url, json=payload, timeout=10)
             
+        # Send authentication request
+        self._start_request(heartbeat, self._on_login_finished,
+                            (self.login_button, self.register_button))
+        
+    def _on_login_finished(self, response, error):
+        """Handle the server response to a login request."""
+        try:
+            if error is not None:
+                raise error
+                
             if response.status_code == 200:
                 data = response.json()
                 if data.get('status') and not data.get('banned'): 
@@ -197,6 +230,9 @@ class GmailDialog(QDialog):
         Validates email format and communicates with the Flask API to send
         the verification email.
         """
+        if self._request_worker is not None:
+            return
+            
         email_address = self.reg_email_input.text().strip()
         
         # Validate email format
@@ -205,13 +241,20 @@ class GmailDialog(QDialog):
             self.reg_email_input.setFocus()
             return
         
+        # Send verification code request
+        url = "https://authen-traffic-api.onrender.com/send_verification_code"
+        payload = {"receiver_email": email_address}
+        
+        self._start_request(lambda: _SESSION.post(url, json=payload, timeout=10),
+                            lambda response, error: self._on_code_sent(email_address, response, error),
+                            (self.send_code_button, self.back_button))
+        
+    def _on_code_sent(self, email_address, response, error):
+        """Handle the server response to a verification code request."""
         try:
-            # Send verification code request
-            url = "https://authen-traffic-api.onrender.com/send_verification_code"
-            payload = {"receiver_email": email_address}
-            
-            response = requests.post(url, json=payload, timeout=10)
-            
+            if error is not None:
+                raise error
+                
             if response.status_code == 200:
                 data = response.json()
                 if data.get('status'):
@@ -240,6 +283,9 @@ class GmailDialog(QDialog):
         Validates code format, sends verification request to server,
         and handles registration completion.
         """
+        if self._request_worker is not None:
+            return
+            
         email_address = self.reg_email_input.text().strip()
         verification_code = self.code_input.text().strip()
         
@@ -249,15 +295,25 @@ class GmailDialog(QDialog):
             self.code_input.setFocus()
             return
         
-        try:
-            # Send verification request
-            url = "https://authen-traffic-api.onrender.com/verify_code"
-            payload = get_info()
+        # Send verification request
+        url = "https://authen-traffic-api.onrender.com/verify_code"
+        
+        def verify():
+            payload = self._get_base_payload()
             payload['receiver_email'] = email_address
             payload['verification_code'] = verification_code
+            return _SESSION.post(url, json=payload, timeout=10)
             
-            response = requests.post(url, json=payload, timeout=10)
-            
+        self._start_request(verify,
+                            lambda response, error: self._on_verify_finished(email_address, response, error),
+                            (self.verify_button, self.back_button))
+        
+    def _on_verify_finished(self, email_address, response, error):
+        """Handle the server response to a verification request."""
+        try:
+            if error is not None:
+                raise error
+                
             if response.status_code == 200:
                 data = response.json()
                 if data.get('status'):
@@ -293,11 +349,49 @@ class GmailDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An unexpected error occurred: {str(e)}")
     
+    def _get_base_payload(self):
+        """
+        Get a copy of the system info payload, collecting it only once per dialog.
+        
+        Runs on the request worker thread, as get_info() makes network lookups.
+        
+        Returns:
+            dict: A fresh copy of the payload for the caller to extend
+        """
+        if self._base_payload is None:
+            payload = get_info()
+            # Keep collecting on retries until the public IP lookup succeeds
+            if not payload.get('public_ip'):
+                return payload
+            self._base_payload = payload
+        return dict(self._base_payload)
+    
+    def _start_request(self, fn, on_finished, buttons):
+        """
+        Run a server request on the thread pool so the dialog stays responsive.
+        
+        Args:
+            fn: Callable performing the request and returning the response
+            on_finished: Called with (response, error) once the request completes
+            buttons: Buttons to disable while the request is in flight
+        """
+        self._busy_buttons = buttons
+        for button in buttons:
+            button.setEnabled(False)
+            
+        def finished(response, error):
+            self._request_worker = None
+            for button in self._busy_buttons:
+                button.setEnabled(True)
+            self._busy_buttons = ()
+            on_finished(response, error)
+            
+        self._request_worker = FunctionWorker(fn)
+        self._request_worker.signals.finished.connect(finished)
+        QThreadPool.globalInstance().start(self._request_worker)
+    
     def _is_valid_gmail(self, email):
-        if not email or not email.endswith("@gmail.com"):
-            return False
-        username = email[:-10]  # Remove "@gmail.com"
-        return bool(username and len(username) > 0)
+        return bool(email and _GMAIL_RE.match(email))
     
     def _enable_verification_input(self):
         self.code_input.setEnabled(True)
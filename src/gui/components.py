@@ -1,7 +1,23 @@
-from PyQt6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QFrame, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtWidgets import QLabel, QPushButton, QStyledItemDelegate, QToolTip
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPointF, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QEvent
+from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QPolygonF, QFont, QFontMetrics
 import cv2 as cv
+import numpy as np
+
+def _blend_polygon(image, contour, color, alpha=0.3):
+    """Tint the inside of a polygon contour in place, touching only its bounding box"""
+    x, y, w, h = cv.boundingRect(contour[0])
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, image.shape[1]), min(y + h, image.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    
+    # Same fill and blend as on the full frame, outside the polygon the blend is a no-op.
+    # Both run as single OpenCV calls over the ROI, so the pixel work stays in compiled code
+    roi = image[y0:y1, x0:x1]
+    overlay = roi.copy()
+    cv.fillPoly(overlay, contour, color, offset=(-x0, -y0))
+    cv.addWeighted(overlay, alpha, roi, 1 - alpha, 0, roi)
 
 class VideoFrameWidget(QLabel):
     coordinates_updated = pyqtSignal(list)
@@ -14,7 +30,16 @@ class VideoFrameWidget(QLabel):
         self.offset_x = 0
         self.offset_y = 0
         self.show_connections = True  # Flag to toggle line display
-        self.saved_polygons = {}  # Store saved polygons with their IDs and types
+        self._reset_polygons()  # Saved polygons, kept as parallel per-polygon lists over one point array
+        self._bg_cache = None  # Frame with the saved polygons blended in, rebuilt when they change
+        self._bg_buf = None  # Reused frame-sized buffer the saved polygons are blended into
+        self._native_pixmap = None  # Last composed frame at image resolution, rescaled on resize
+        self._scaled_key = None  # Pixmap and widget size the displayed pixmap was scaled for
+        # Redraw requests are coalesced into one update_display per event-loop turn
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update_display)
         self.setMinimumSize(800, 600)
         self.setStyleSheet("""
             QLabel {
@@ -30,74 +55,71 @@ class VideoFrameWidget(QLabel):
     def set_frame(self, frame):
         self.frame = frame.copy()
         self.coordinates = []
-        self.update_display()
+        self._bg_cache = None
+        self._schedule_update()
+    
+    def _render_background(self):
+        """Blend the saved polygons into a copy of the frame and cache it"""
+        # Nothing to blend, the frame itself is the background
+        if not self._polys_ids:
+            self._bg_cache = self.frame
+            return self.frame
+        
+        if self._bg_buf is None or self._bg_buf.shape != self.frame.shape \
+                or self._bg_buf.dtype != self.frame.dtype:
+            self._bg_buf = np.empty_like(self.frame)
+        background = self._bg_buf
+        np.copyto(background, self.frame)
+
+        # Draw saved polygons first (underneath current drawing). Each is blended over its own bounding
+        # box, zones spread across the frame would make one batched fill per color blend most of it
+        points, offsets = self._polys_xy, self._polys_offsets
+        for i, color in enumerate(self._polys_colors):
+            start, end = offsets[i], offsets[i + 1]
+            
+            if end - start >= 3:
+                # Blend a semi-transparent fill for saved polygons (30% transparency),
+                # the contour is a view into the shared point array
+                contour = points[np.newaxis, start:end]
+                _blend_polygon(background, contour, color)
+                
+                # Draw polygon border with darker version of the color
+                cv.drawContours(background, contour, -1, self._polys_border_colors[i], thickness=2)
+
+        self._bg_cache = background
+        return background
+    
+    def _schedule_update(self):
+        """Redraw on the next event-loop turn, once for any number of requests before it"""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
     
     def update_display(self):
+        self._update_timer.stop()
         if self.frame is None:
             return
 
-        # Create display frame
-        display_frame = self.frame.copy()
+        # Display the frame with the saved polygons, blended and converted only when they change.
+        # The polygon being drawn is painted over it in paintEvent
+        if self._bg_cache is None:
+            display_frame = self._render_background()
 
-        # Draw saved polygons first (underneath current drawing)
-        import numpy as np
-        for polygon in self.saved_polygons.values():
-            coords = polygon['coordinates']
-            color = polygon['color']
-            
-            if len(coords) >= 3:
-                # Create semi-transparent overlay for saved polygons
-                overlay = display_frame.copy()
-                contour = np.array([coords], dtype=np.int32)
-                cv.drawContours(overlay, contour, -1, color, thickness=cv.FILLED)
-                
-                # Blend with original (30% transparency)
-                cv.addWeighted(overlay, 0.3, display_frame, 0.7, 0, display_frame)
-                
-                # Draw polygon border with darker version of the color
-                border_color = tuple(int(c * 0.8) for c in color)
-                cv.drawContours(display_frame, contour, -1, border_color, thickness=2)
-
-        # Draw current polygon being drawn
-        if len(self.coordinates) >= 3:
-            # Create semi-transparent overlay
-            overlay = display_frame.copy()
-            contour = np.array([self.coordinates], dtype=np.int32)
-            cv.drawContours(overlay, contour, -1, (0, 255, 0), thickness=cv.FILLED)
-            
-            # Blend with original (30% transparency)
-            cv.addWeighted(overlay, 0.3, display_frame, 0.7, 0, display_frame)
-            
-            # Draw polygon border
-            cv.drawContours(display_frame, contour, -1, (0, 200, 0), thickness=2)
-
-        # Draw connecting lines for current polygon
-        if self.show_connections and len(self.coordinates) > 1:
-            for i in range(len(self.coordinates) - 1):
-                pt1 = (int(self.coordinates[i][0]), int(self.coordinates[i][1]))
-                pt2 = (int(self.coordinates[i + 1][0]), int(self.coordinates[i + 1][1]))
-                cv.line(display_frame, pt1, pt2, (255, 0, 0), 2)
-            
-            # Close polygon
-            if len(self.coordinates) >= 3:
-                pt1 = (int(self.coordinates[-1][0]), int(self.coordinates[-1][1]))
-                pt2 = (int(self.coordinates[0][0]), int(self.coordinates[0][1]))
-                cv.line(display_frame, pt1, pt2, (255, 0, 0), 2)
-
-        # Draw points for current polygon
-        for i, (x, y) in enumerate(self.coordinates):
-            center = (int(x), int(y))
-            cv.circle(display_frame, center, 8, (0, 255, 0), -1)  # Green filled circle
-            cv.circle(display_frame, center, 8, (255, 255, 255), 2)  # White border
-
-        # Convert to Qt format
-        height, width, channel = display_frame.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(display_frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).rgbSwapped()
-
-        # Scale to fit widget
+            # Convert to Qt format
+            height, width, channel = display_frame.shape
+            bytes_per_line = 3 * width
+            q_image = QImage(display_frame.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
+            self._native_pixmap = QPixmap.fromImage(q_image)
+        self._show_scaled_pixmap()
+
+    def _show_scaled_pixmap(self):
+        """Scale the composed frame to fit the widget and update the coordinate mapping"""
+        # Scale to fit widget, unless the displayed pixmap is already this frame at this size
         widget_size = self.size()
-        pixmap = QPixmap.fromImage(q_image)
+        pixmap = self._native_pixmap
+        key = (pixmap.cacheKey(), widget_size.width(), widget_size.height())
+        if key == self._scaled_key:
+            return
+        width, height = pixmap.width(), pixmap.height()
         scaled_pixmap = pixmap.scaled(widget_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
 
         # Calculate scale factor and offset for coordinate mapping
@@ -108,15 +130,59 @@ class VideoFrameWidget(QLabel):
         self.offset_y = (widget_size.height() - scaled_height) // 2
 
         self.setPixmap(scaled_pixmap)
+        self._scaled_key = key
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.frame is None or not self.coordinates:
+            return
+        
+        # Paint the polygon being drawn over the displayed frame, in image coordinates
+        # mapped onto it and centered on pixels as OpenCV draws them
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(self.offset_x, self.offset_y)
+        painter.scale(self.scale_factor, self.scale_factor)
+        painter.translate(0.5, 0.5)
+        polygon = QPolygonF([QPointF(x, y) for x, y in self.coordinates])
+        
+        if len(polygon) >= 3:
+            # Semi-transparent fill (30% transparency) with its border
+            painter.setPen(QPen(QColor(0, 200, 0), 2))
+            painter.setBrush(QColor(0, 255, 0, 77))
+            painter.drawPolygon(polygon)
+        
+        # Draw connecting lines for current polygon, closed once it has 3 points
+        if self.show_connections and len(polygon) > 1:
+            painter.setPen(QPen(QColor(0, 0, 255), 2))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            if len(polygon) >= 3:
+                painter.drawPolygon(polygon)
+            else:
+                painter.drawPolyline(polygon)
+        
+        # Draw points for current polygon, green filled circles of radius 8 with a 2px white border,
+        # as two batched round-pen passes: white discs out to the border, then the green inside
+        for color, width in (((255, 255, 255), 18), ((0, 255, 0), 14)):
+            pen = QPen(QColor(*color), width)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            painter.setPen(pen)
+            painter.drawPoints(polygon)
+        painter.end()
 
     def mousePressEvent(self, event):
         if self.frame is None:
             return
         
         if event.button() == Qt.MouseButton.LeftButton:
+            # The mapping below comes from the last redraw, bring it up to date first
+            if self._update_timer.isActive():
+                self.update_display()
+            
             # Convert widget coordinates to image coordinates
-            widget_x = event.position().x() - self.offset_x
-            widget_y = event.position().y() - self.offset_y
+            pos = event.position()
+            widget_x = pos.x() - self.offset_x
+            widget_y = pos.y() - self.offset_y
             
             if widget_x >= 0 and widget_y >= 0:
                 image_x = widget_x / self.scale_factor
@@ -126,112 +192,224 @@ class VideoFrameWidget(QLabel):
                 if 0 <= image_x < self.frame.shape[1] and 0 <= image_y < self.frame.shape[0]:
                     self.coordinates.append((int(image_x), int(image_y)))
                     self.coordinates_updated.emit(self.coordinates)
-                    self.update_display()
+                    self.update()
     
     def clear_coordinates(self):
         self.coordinates = []
         self.coordinates_updated.emit(self.coordinates)
-        self.update_display()
+        self.update()
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self.frame is not None:
-            self.update_display()
+        # Only the widget geometry changed, rescale the last composed frame
+        if self._native_pixmap is not None:
+            self._show_scaled_pixmap()
+        elif self.frame is not None:
+            self._schedule_update()
     
     def add_existing_polygon(self, coordinates, polygon_id):
         """Add an existing polygon (orange color) to be displayed"""
-        self.saved_polygons[polygon_id] = {
-            'coordinates': coordinates,
-            'type': 'existing',
-            'color': (255, 153, 0)  # Orange color for existing
-        }
-        self.update_display()
+        self._store_polygon(polygon_id, coordinates, (255, 153, 0))  # Orange color for existing
     
     def add_new_polygon(self, coordinates, polygon_id):
         """Add a new polygon (green color) to be displayed"""
-        self.saved_polygons[polygon_id] = {
-            'coordinates': coordinates,
-            'type': 'new',
-            'color': (0, 255, 0)  # Green color for new
-        }
-        self.update_display()
+        self._store_polygon(polygon_id, coordinates, (0, 255, 0))  # Green color for new
+    
+    def _reset_polygons(self):
+        """Drop all saved polygons"""
+        self._polys_ids = []
+        self._polys_colors = []
+        self._polys_border_colors = []
+        self._polys_xy = np.empty((0, 2), dtype=np.int32)  # Points of every polygon, back to back
+        self._polys_offsets = [0]  # Polygon i is _polys_xy[offsets[i]:offsets[i + 1]]
+    
+    def _splice_points(self, index, points):
+        """Replace the points of polygon `index` in the shared array, shifting the ones after it"""
+        start, end = self._polys_offsets[index], self._polys_offsets[index + 1]
+        self._polys_xy = np.concatenate((self._polys_xy[:start], points, self._polys_xy[end:]))
+        shift = len(points) - (end - start)
+        for i in range(index + 1, len(self._polys_offsets)):
+            self._polys_offsets[i] += shift
+    
+    def _store_polygon(self, polygon_id, coordinates, color):
+        """Save a polygon with its points and darker border color worked out once"""
+        points = np.array(coordinates, dtype=np.int32).reshape(-1, 2)
+        border_color = tuple(int(c * 0.8) for c in color)
+        
+        if polygon_id in self._polys_ids:
+            # Replace in place so the polygon keeps its drawing order
+            index = self._polys_ids.index(polygon_id)
+            self._splice_points(index, points)
+            self._polys_colors[index] = color
+            self._polys_border_colors[index] = border_color
+        else:
+            self._polys_ids.append(polygon_id)
+            self._polys_colors.append(color)
+            self._polys_border_colors.append(border_color)
+            self._polys_xy = np.concatenate((self._polys_xy, points))
+            self._polys_offsets.append(len(self._polys_xy))
+        self._bg_cache = None
+        self._schedule_update()
     
     def remove_polygon(self, polygon_id):
         """Remove a polygon by its ID"""
-        if polygon_id in self.saved_polygons:
-            del self.saved_polygons[polygon_id]
-            self.update_display()
+        if polygon_id in self._polys_ids:
+            index = self._polys_ids.index(polygon_id)
+            self._splice_points(index, self._polys_xy[:0])
+            del self._polys_offsets[index + 1]
+            del self._polys_ids[index]
+            del self._polys_colors[index]
+            del self._polys_border_colors[index]
+            self._bg_cache = None
+            self._schedule_update()
     
     def clear_all_polygons(self):
         """Clear all saved polygons"""
-        self.saved_polygons = {}
-        self.update_display()
+        self._reset_polygons()
+        self._bg_cache = None
+        self._schedule_update()
+
+class CoordinateCardModel(QAbstractListModel):
+    """List model exposing saved frame dictionaries to the coordinate card view"""
+    FrameRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, frames=None, parent=None):
+        super().__init__(parent)
+        self.frames = list(frames or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.frames)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.frames):
+            return None
+        frame = self.frames[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Frame {frame['id']}"
+        if role == self.FrameRole:
+            return frame
+        return None
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self.frames):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.frames[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def add_frame(self, frame):
+        """Append a saved frame as a new card"""
+        row = len(self.frames)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.frames.append(frame)
+        self.endInsertRows()
+
+    def remove_frame(self, frame_id):
+        """Remove the card of a saved frame by its ID"""
+        for row, frame in enumerate(self.frames):
+            if frame['id'] == frame_id:
+                return self.removeRow(row)
+        return False
+
+    def clear(self):
+        """Remove every card"""
+        self.beginResetModel()
+        self.frames = []
+        self.endResetModel()
+
+class CoordinateCardDelegate(QStyledItemDelegate):
+    """Paints a coordinate card for each model row instead of building widgets"""
+    card_deleted = pyqtSignal(int)  # frame_id of the card whose delete button was clicked
+    MARGIN = 5
+    PADDING = 12
+    RADIUS = 8
+    BUTTON_SIZE = 30
+    SPACING = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont("Arial")
+        self._title_font.setPixelSize(14)
+        self._title_font.setBold(True)
+        self._button_font = QFont("Arial")
+        self._button_font.setPixelSize(13)
+        self._coords_font = QFont("Consolas")
+        self._coords_font.setStyleHint(QFont.StyleHint.Monospace)
+        self._coords_font.setPixelSize(12)
+        self._line_height = QFontMetrics(self._coords_font).lineSpacing()
+
+    def sizeHint(self, option, index):
+        frame = index.data(CoordinateCardModel.FrameRole)
+        points = len(frame['coordinates']) if frame else 0
+        height = 2 * (self.MARGIN + self.PADDING) + self.BUTTON_SIZE + self.SPACING + points * self._line_height
+        return QSize(200, height)
+
+    def _card_rect(self, rect):
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def _delete_rect(self, rect):
+        """Area of the delete button in the card's top right corner"""
+        inner = self._card_rect(rect).adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        return QRect(inner.right() - self.BUTTON_SIZE + 1, inner.top(), self.BUTTON_SIZE, self.BUTTON_SIZE)
+
+    def paint(self, painter, option, index):
+        frame = index.data(CoordinateCardModel.FrameRole)
+        if not frame:
+            return
+
+        card = self._card_rect(option.rect)
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card background with rounded border
+        painter.setPen(QPen(QColor("#666666"), 1))
+        painter.setBrush(QColor("#1a1a1a"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), self.RADIUS, self.RADIUS)
 
-class CoordinateCard(QFrame):
-    card_deleted = pyqtSignal(int)
-    
-    def __init__(self, frame_id, coordinates):
-        super().__init__()
-        self.frame_id = frame_id
-        self.coordinates = coordinates
-        self.setup_ui()
-    
-    def setup_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background: #1a1a1a;
-                border: 1px solid #666666;
-                border-radius: 8px;
-                margin: 5px;
-                padding: 10px;
-            }
-        """)
-        
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        
         # Header with title and delete button
-        header_layout = QHBoxLayout()
-        
-        # Frame title
-        title = QLabel(f"Frame {self.frame_id}")
-        title.setStyleSheet("""
-            QLabel {
-                color: #4a9eff;
-                font-weight: bold;
-                font-size: 14px;
-                margin-bottom: 5px;
-            }
-        """)
-        header_layout.addWidget(title)
-        
-        # Delete button
-        delete_btn = DarkButton("🗑️", danger=True)
-        delete_btn.setFixedSize(30, 30)
-        delete_btn.setToolTip("Delete this frame")
-        delete_btn.clicked.connect(self.delete_card)
-        header_layout.addWidget(delete_btn)
-        
-        main_layout.addLayout(header_layout)
-        
-        # Coordinates
-        coords_text = ""
-        for i, (x, y) in enumerate(self.coordinates):
-            coords_text += f"Point {i+1}: ({x}, {y})\n"
-        
-        coords_label = QLabel(coords_text.strip())
-        coords_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 12px;
-                font-family: 'Consolas', 'Monaco', monospace;
-            }
-        """)
-        main_layout.addWidget(coords_label)
-    
-    def delete_card(self):
-        # Emit signal with frame_id to parent
-        self.card_deleted.emit(self.frame_id)
+        button = self._delete_rect(option.rect)
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#4a9eff"))
+        painter.drawText(QRect(inner.left(), inner.top(), button.left() - inner.left(), self.BUTTON_SIZE),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, f"Frame {frame['id']}")
+
+        painter.setPen(QPen(QColor("#666666"), 1))
+        painter.setBrush(QColor("#ff0000"))
+        painter.drawRoundedRect(QRectF(button).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        painter.setFont(self._button_font)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "🗑️")
+
+        # Coordinates, one line per point
+        coords_text = "\n".join(f"Point {i+1}: ({x}, {y})" for i, (x, y) in enumerate(frame['coordinates']))
+        top = inner.top() + self.BUTTON_SIZE + self.SPACING
+        painter.setFont(self._coords_font)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(QRect(inner.left(), top, inner.width(), inner.bottom() - top + 1),
+                         Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, coords_text)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # A click released on the delete button deletes the card's frame
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton \
+                and self._delete_rect(option.rect).contains(event.position().toPoint()):
+            frame = index.data(CoordinateCardModel.FrameRole)
+            if frame:
+                self.card_deleted.emit(frame['id'])
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip and self._delete_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Delete this frame", view)
+            return True
+        return super().helpEvent(event, view, option, index)
 
 class DarkButton(QPushButton):
     def __init__(self, text, primary=False, danger=False):
@@ -1,12 +1,13 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QFrame,
-                            QMessageBox, QSplitter, QScrollArea)
+                            QMessageBox, QSplitter, QListView, QAbstractItemView)
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from src.gui.components import VideoFrameWidget, DarkButton, CoordinateCard
+from src.gui.components import VideoFrameWidget, DarkButton, CoordinateCardModel, CoordinateCardDelegate
 from src.config.utils import CameraConfigManager
 from ..utils import is_valid_polygon
 import cv2 as cv
 import numpy as np
+import os
 from datetime import datetime
 
 class RoadSegmenterGUI(QMainWindow):
@@ -31,6 +32,7 @@ class RoadSegmenterGUI(QMainWindow):
         self.saved_frames = []
         self.existing_frames = []  # Initialize existing_frames to prevent AttributeError
         self.cap = None
+        self._cached_frame = None  # (image_path, file stamp, frame) of the last decoded image
         self.last_frame_time = None
         self.time_label = None
         self.date_label = None
@@ -113,7 +115,7 @@ class RoadSegmenterGUI(QMainWindow):
                 self.image_path = self.camera.get('image_path', None)
 
             print(f"Loading image from path: {self.image_path}")
-            frame = cv.imread(self.image_path)
+            frame = self._read_frame(self.image_path)
             if frame is None:
                 QMessageBox.warning(self, "Image Load Error", "Failed to load image from the specified path.")
                 return
@@ -131,6 +133,23 @@ class RoadSegmenterGUI(QMainWindow):
         except Exception as e:
             print(f"Error loading frame: {e}")
         
+    def _read_frame(self, image_path):
+        """Decode the camera image, reusing the last decode while the file is unchanged"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return cv.imread(image_path)
+        
+        # Key on the file stamp so a rewritten image is decoded again
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._cached_frame is not None and self._cached_frame[:2] == (image_path, stamp):
+            return self._cached_frame[2]
+        
+        frame = cv.imread(image_path)
+        if frame is not None:
+            self._cached_frame = (image_path, stamp, frame)
+        return frame
+        
     def load_existing_detection_zones(self, existing_zones):
         """Load existing detection zones and display them as coordinate cards"""
         if not existing_zones:
@@ -138,6 +157,19 @@ class RoadSegmenterGUI(QMainWindow):
         
         self.existing_frames = []
 
+        # Add every zone's polygon and card in one repaint instead of one per zone
+        self.setUpdatesEnabled(False)
+        try:
+            self._add_existing_zones(existing_zones)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Enable submit button if there are existing zones
+        if self.saved_frames:
+            self.submit_btn.setEnabled(False)
+
+    def _add_existing_zones(self, existing_zones):
+        """Add a polygon and coordinate card for each existing zone with points"""
         for zone in existing_zones:
             polygon_points = zone.get('polygon_points', [])
             if not polygon_points:
@@ -162,15 +194,9 @@ class RoadSegmenterGUI(QMainWindow):
                 self.video_widget.add_existing_polygon(coordinates, self.frame_counter)
                 
                 # Create card for existing zone
-                card = CoordinateCard(self.frame_counter, coordinates)
-                card.card_deleted.connect(self.delete_frame)
-                self.cards_layout.addWidget(card)
+                self.cards_model.add_frame(frame_data)
                 
                 self.frame_counter += 1
-        
-        # Enable submit button if there are existing zones
-        if self.saved_frames:
-            self.submit_btn.setEnabled(False)
 
     def create_menu_panel(self):
         panel = QFrame()
@@ -289,13 +315,20 @@ class RoadSegmenterGUI(QMainWindow):
         """)
         layout.addWidget(saved_frame_label)
         
-        # Scroll area for saved frames
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMinimumHeight(200)  # Set minimum height for larger saved frame area
-        # scroll.setMaximumHeight(300)  # Set maximum height to prevent it from being too large
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # Card view for saved frames: only the visible cards are painted, no widget per frame
+        self.cards_model = CoordinateCardModel()
+        self.cards_delegate = CoordinateCardDelegate(self)
+        self.cards_delegate.card_deleted.connect(self.delete_frame)
+        self.cards_view = QListView()
+        self.cards_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.cards_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.cards_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.cards_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.cards_view.setModel(self.cards_model)
+        self.cards_view.setItemDelegate(self.cards_delegate)
+        self.cards_view.setMinimumHeight(200)  # Set minimum height for larger saved frame area
+        self.cards_view.setStyleSheet("""
+            QListView {
                 background: transparent;
                 border: 1px solid #666666;
                 border-radius: 8px;
@@ -315,12 +348,7 @@ class RoadSegmenterGUI(QMainWindow):
             }
         """)
         
-        self.cards_widget = QWidget()
-        self.cards_layout = QVBoxLayout(self.cards_widget)
-        self.cards_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.cards_layout.setSpacing(5)
-        scroll.setWidget(self.cards_widget)
-        layout.addWidget(scroll, 1)  # Add stretch factor of 1 to make it expand
+        layout.addWidget(self.cards_view, 1)  # Add stretch factor of 1 to make it expand
         
         # New Shot button
         self.new_shot_btn = DarkButton("New Shot")
@@ -438,9 +466,7 @@ class RoadSegmenterGUI(QMainWindow):
         self.video_widget.add_new_polygon(self.current_coordinates.copy(), self.frame_counter)
         
         # Create card
-        card = CoordinateCard(self.frame_counter, self.current_coordinates)
-        card.card_deleted.connect(self.delete_frame)  # Connect delete signal
-        self.cards_layout.addWidget(card)
+        self.cards_model.add_frame(frame_data)
         
         self.frame_counter += 1
         self.submit_btn.setEnabled(True)
@@ -465,15 +491,8 @@ class RoadSegmenterGUI(QMainWindow):
             # Remove from saved_frames
             self.saved_frames = [frame for frame in self.saved_frames if frame['id'] != frame_id]
             
-            # Remove card from layout
-            for i in range(self.cards_layout.count()):
-                item = self.cards_layout.itemAt(i)
-                if item and item.widget():
-                    card = item.widget()
-                    if hasattr(card, 'frame_id') and card.frame_id == frame_id:
-                        card.setParent(None)
-                        card.deleteLater()
-                        break
+            # Remove card from the view
+            self.cards_model.remove_frame(frame_id)
             
             # Update submit button state
             self.submit_btn.setEnabled(len(self.saved_frames) > 0 and (self.saved_frames != self.existing_frames))
@@ -584,15 +603,9 @@ class RoadSegmenterGUI(QMainWindow):
             self.video_widget.clear_coordinates()
             self.video_widget.clear_all_polygons()
         
-        # Clear all frame cards from the layout
-        if hasattr(self, 'cards_layout'):
-            # Remove all cards from the layout
-            while self.cards_layout.count():
-                item = self.cards_layout.takeAt(0)
-                if item and item.widget():
-                    widget = item.widget()
-                    widget.setParent(None)
-                    widget.deleteLater()
+        # Clear all frame cards from the view
+        if hasattr(self, 'cards_model'):
+            self.cards_model.clear()
         
         # Reset button states
         if hasattr(self, 'add_frame_btn'):
@@ -76,7 +76,7 @@ class Window(QMainWindow):
         self.dashboard = Dashboard(cameras_name=self.camera_names, camera_statuses=self.camera_statuses, use_gpu=self.use_gpu)
         self.config_page = RoadSegmenterGUI()
 
-        self.dashboard.switch_to_config_page.connect(lambda camera: self.show_config_page(camera=camera))
+        self.dashboard.switch_to_config_page.connect(self.show_config_page)
         self.config_page.switch_to_dashboard_page.connect(self.show_dashboard)
         
         # Pass camera manager to config page so it can get frames
@@ -143,15 +143,7 @@ class Window(QMainWindow):
         print("Shutting down application threads...")
         
         try:
-            # Shutdown dashboard camera manager threads first
-            if hasattr(self, 'dashboard') and hasattr(self.dashboard, 'camera_manager'):
-                print("Shutting down camera manager...")
-                self.dashboard.camera_manager.shutdown()
-        except Exception as e:
-            print(f"Error shutting down camera manager: {e}")
-        
-        try:
-            # Clean up dashboard resources
+            # Clean up dashboard resources, including its camera manager threads
             if hasattr(self, 'dashboard'):
                 print("Cleaning up dashboard...")
                 self.dashboard.cleanup()
@@ -0,0 +1,28 @@
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QObject, QRunnable
+import logging
+
+logger = logging.getLogger(__name__)
+
+class FunctionWorkerSignals(QObject):
+    """Defines the signals available from a running function worker"""
+    finished = pyqtSignal(object, object)  # return value or None, exception or None
+
+class FunctionWorker(QRunnable):
+    """Worker for running a blocking function on the thread pool, off the GUI thread"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = FunctionWorkerSignals()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result, error = self.fn(), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            self.signals.finished.emit(result, error)
+        except RuntimeError as e:
+            # The signals object went away with the widget that was waiting for the result
+            logger.debug("Worker finished after its receiver was closed: %s", e)
@@ -4,6 +4,19 @@ import cv2 as cv
 from datetime import datetime
 import os
 
+# Working directory at startup, relative video sources resolve against it
+ROOT_DIR = os.path.abspath(os.curdir)
+
+# Shared by the capture helpers, it only re-parses the config file when the file changes
+_config_manager = None
+
+def _get_config_manager():
+    """Return the camera config manager shared by the capture helpers, creating it on first use"""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = CameraConfigManager()
+    return _config_manager
+
 def capture_video(camera_id):
     """
     Capture video from a camera using OpenCV.
@@ -14,7 +27,7 @@ def capture_video(camera_id):
     Returns:
         VideoCapture: OpenCV VideoCapture object for the camera.
     """
-    camM = CameraConfigManager()
+    camM = _get_config_manager()
     camera = camM.get_camera_by_id(camera_id)
     if not camera:
         raise ValueError(f"Camera with ID {camera_id} not found.")
@@ -42,7 +55,7 @@ def capture_video(camera_id):
         cv.destroyAllWindows()
 
 def capture_one_frame(camera_id):
-    camM = CameraConfigManager()
+    camM = _get_config_manager()
     camera = camM.get_camera_by_id(camera_id)
     if not camera:
         raise ValueError(f"Camera with ID {camera_id} not found.")
@@ -77,7 +90,7 @@ def capture_one_frame_silent(camera_id):
         np.ndarray: The captured frame, or None if capture failed.
     """
     print(f'{datetime.now()} Capturing one frame from camera: {camera_id}')
-    camM = CameraConfigManager()
+    camM = _get_config_manager()
     camera = camM.get_camera_by_id(camera_id)
     if not camera:
         raise ValueError(f"Camera with ID {camera_id} not found.")
@@ -89,7 +102,6 @@ def capture_one_frame_silent(camera_id):
         # Check if it's a relative path
         if not os.path.isabs(video_source):
             # Convert to absolute path
-            ROOT_DIR = os.path.abspath(os.curdir)
             video_source = os.path.join(ROOT_DIR, video_source)
 
     cap = cv.VideoCapture(video_source)